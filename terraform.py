@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 
+import bisect
+import concurrent.futures
 import curses
+import hashlib
+import json
 import os
 import hcl2
+import pickle
 import re
 import subprocess
 import tempfile
 import signal
 import sys
+import time
+from functools import lru_cache
 from pygments import highlight
 from pygments.lexers import get_lexer_by_name
 from pygments.formatters import TerminalFormatter
@@ -16,6 +23,78 @@ from pygments.styles import get_style_by_name
 selected_index = 0
 selected_block_index = -1  # For selecting blocks in the second column
 
+# Block header patterns used by the fallback parser when HCL2 parsing fails,
+# combined into one alternation so the raw content is scanned once. The outer
+# group of each alternative is named after its block type (see match.lastgroup).
+_FALLBACK_RE = re.compile(r'''
+    (?P<resource>resource\s+"(?P<resource_type>[^"]+)"\s+"(?P<resource_name>[^"]+)")
+  | (?P<data>data\s+"(?P<data_type>[^"]+)"\s+"(?P<data_name>[^"]+)")
+  | (?P<variable>variable\s+"(?P<variable_name>[^"]+)")
+  | (?P<output>output\s+"(?P<output_name>[^"]+)")
+  | (?P<provider>provider\s+"?(?P<provider_name>[^"\s{]+)"?)
+  | (?P<module>module\s+"(?P<module_name>[^"]+)")
+  | (?P<locals>locals\s+{)
+  | (?P<terraform>terraform\s+{)
+''', re.VERBOSE)
+_FALLBACK_TYPES = ("resource", "data", "variable", "output", "provider", "module", "locals", "terraform")
+
+# Invariant patterns used when extracting raw block content
+_NEXT_BLOCK_RE = re.compile(r'(?:^|\n)\s*(resource|provider|variable|output|locals|module|data)\s+', re.MULTILINE)
+_LOCAL_VAR_RE = re.compile(r'(\w+)\s*=(?!=)')
+
+# Comment, or block keyword followed by a space and more text, at the start of
+# a line, matched in one call by _classify
+_HL_RE = re.compile(r'\s*(?:(?P<comment>#)|(?P<keyword>(?:resource|variable|provider|module|data|output|locals|terraform) \s*\S))')
+
+# Highlighting attributes, set to their color pairs by init_colors when the
+# terminal supports colors
+_LINE_ATTRS = (curses.A_NORMAL,) * 5  # color pair number from _classify -> attribute
+_HAS_COLORS = False                    # curses.has_colors(), checked once by init_colors
+
+# ANSI sequence to clear the terminal and home the cursor, used instead of
+# spawning `clear` while curses is suspended
+_CLEAR = '\x1b[2J\x1b[H'
+
+# Number of extracted blocks kept by the block cache, tunable with
+# TFTUI_CACHE_SIZE for very large repositories
+try:
+    _CACHE_SIZE = max(1, int(os.environ.get("TFTUI_CACHE_SIZE", "2048")))
+except ValueError:
+    _CACHE_SIZE = 2048
+
+# Per-file caches reused across redraws and reloads, invalidated when a file's
+# mtime or size changes
+_file_mtimes = {}     # file name -> (absolute path, st_mtime_ns, st_size)
+_parse_cache = {}     # file name -> (parsed content, raw text, content digest)
+_parsed_by_digest = {}  # content digest -> (parsed content, parse warning), shared by identical files
+_blocks_by_file = {}  # file name -> list of (block_type, name, lookup_name) entries
+_block_positions = {} # file name -> {(block_type, name): index of its first entry in _blocks_by_file}
+_block_cache = {}     # (file name, block_type, block_name) -> (content, start, end), least recently used first
+_category_index = (None, {})  # (parsed data, category -> list of "file:name" entries)
+_module_index = (None, None, (), {})  # (parsed data, files, files with modules, file -> module names)
+_file_positions = (None, {})  # (file list, file name -> index in the list)
+
+# Parse results kept on disk across runs, one pickle per content digest. Entries
+# are tagged with the format version and the hcl2 version that produced them,
+# expire after a week and the least recently used ones are removed beyond a cap
+_DISK_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "terraform_tui")
+_DISK_CACHE_TAG = (1, getattr(hcl2, "__version__", ""))
+_DISK_CACHE_TTL = 7 * 86400
+_DISK_CACHE_MAX_ENTRIES = 5000
+
+# Block categories listed by the category view, in display order
+_CATEGORIES = ("resource", "variable", "data", "output", "locals", "provider", "module", "terraform")
+
+# Results of `terraform workspace list` for non-local backends, reused for a
+# couple of seconds since every call forks the terraform binary
+_WORKSPACE_TTL = 2.0
+_ws_cache = {}        # ("list", working dir) -> (monotonic time, workspaces)
+_now = time.monotonic
+
+# Worker threads running terraform workspace commands started from the TUI, so
+# the UI keeps redrawing while the terraform binary runs
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
 # Check if a directory contains Terraform files
 def has_terraform_files(directory):
     """Check if the specified directory contains .tf or .tfstate files."""
@@ -35,7 +114,8 @@ def select_directory(stdscr):
     curses.endwin()
     
     # Clear screen for better UX
-    os.system('clear')
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
     print("\n\n==== TERRAFORM DIRECTORY SELECTION ====")
     print("No Terraform files (.tf, .tfstate) found in the current directory.")
     print("Please enter the path to a directory containing Terraform files:")
@@ -75,34 +155,189 @@ def select_directory(stdscr):
     
     return directory
 
-# Parse .tf and .tfvars files
-def parse_terraform_files(directory):
-    terraform_data = {}
-    for file in os.listdir(directory):
-        if file.endswith(".tf") or file.endswith(".tfvars"):
-            file_path = os.path.join(directory, file)
-            
-            # Always store the raw file content first to ensure we have it even if parsing fails
+# Drop cached blocks and block content for a file
+def _invalidate_file_caches(file):
+    _parse_cache.pop(file, None)
+    _blocks_by_file.pop(file, None)
+    _block_positions.pop(file, None)
+    for key in [key for key in _block_cache if key[0] == file]:
+        del _block_cache[key]
+
+# Check whether any .tf or .tfvars file was added, removed or modified
+def terraform_files_changed(directory):
+    """Return True if the files in directory differ from the ones last parsed"""
+    seen = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith((".tf", ".tfvars")) or not entry.is_file():
+                    continue
+                seen += 1
+                stat = entry.stat()
+                stamp = (os.path.abspath(entry.path), stat.st_mtime_ns, stat.st_size)
+                if _file_mtimes.get(entry.name) != stamp:
+                    return True
+    except OSError:
+        return False
+    return seen != len(_file_mtimes)
+
+# Unpickler for the disk cache that only builds plain containers and scalars
+class _DataUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in the parse cache")
+
+# Load a parse result from the disk cache, None when missing, stale or unreadable
+def _load_cached_parse(digest):
+    path = os.path.join(_DISK_CACHE_DIR, digest.hex() + ".pickle")
+    try:
+        if time.time() - os.stat(path).st_mtime > _DISK_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            tag, parsed, warning = _DataUnpickler(f).load()
+        if tag != _DISK_CACHE_TAG:
+            return None
+        os.utime(path)  # Mark as recently used for prune_disk_cache
+        return parsed, warning
+    except Exception:
+        return None
+
+# Store a parse result in the disk cache, replacing the file atomically
+def _store_cached_parse(digest, parsed, warning):
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=_DISK_CACHE_DIR, suffix=".tmp", delete=False) as f:
+            pickle.dump((_DISK_CACHE_TAG, parsed, warning), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, os.path.join(_DISK_CACHE_DIR, digest.hex() + ".pickle"))
+    except Exception:
+        pass  # The cache is only an optimization
+
+# Remove expired disk cache entries and the least recently used ones beyond the cap
+def prune_disk_cache():
+    try:
+        with os.scandir(_DISK_CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_file()]
+    except OSError:
+        return
+    files.sort(reverse=True)
+    cutoff = time.time() - _DISK_CACHE_TTL
+    for index, (mtime, path) in enumerate(files):
+        if index >= _DISK_CACHE_MAX_ENTRIES or mtime < cutoff:
             try:
-                with open(file_path, 'r') as raw_f:
-                    terraform_data[file + "_raw"] = raw_f.read()
-            except Exception as e:
-                terraform_data[file + "_raw"] = f"Error reading file: {str(e)}"
-                continue  # Skip parsing if we can't even read the file
-            
-            # Now try to parse the file
+                os.remove(path)
+            except OSError:
+                pass
+
+# Read and parse a single file, reusing an earlier parse of the same content
+def _parse_file(file_path):
+    """Return (parsed, raw, warning, digest); parsed is None if the file could not be read"""
+    # Always read the raw file content first to ensure we have it even if parsing fails
+    try:
+        with open(file_path, 'r') as raw_f:
+            raw = raw_f.read()
+    except Exception as e:
+        return None, f"Error reading file: {str(e)}", None, None  # Skip parsing if we can't even read the file
+    
+    # Files with identical content (copied modules, or a file that was only
+    # touched) share a single parse
+    digest = hashlib.blake2b(raw.encode(), digest_size=16).digest()
+    cached = _parsed_by_digest.get(digest) or _load_cached_parse(digest)
+    if cached is not None:
+        return cached[0], raw, cached[1], digest
+    
+    # Now try to parse the file, reusing the content read above
+    try:
+        parsed, warning = hcl2.loads(raw), None
+    except Exception as e:
+        # If parsing fails, create a fallback structure based on regex patterns
+        # This ensures we can show something in the UI even if HCL parser fails
+        parsed, warning = extract_fallback_structure(raw), str(e)
+    _store_cached_parse(digest, parsed, warning)
+    return parsed, raw, warning, digest
+
+# Stat the .tf and .tfvars files and read and parse the changed ones. Only reads
+# the caches, so it can run on a worker thread while the UI keeps drawing
+def scan_terraform_files(directory):
+    """
+    Return (stamps, parsed): (file name, stamp) for every .tf and .tfvars file
+    in directory, in directory order, and the _parse_file result of every file
+    whose stamp differs from the one its cached parse was made from.
+    """
+    stamps = []
+    changed = []  # (file name, path) of files that need to be read and parsed
+    # scandir yields entries with cached type info, so no extra stat per name
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith((".tf", ".tfvars")) or not entry.is_file():
+                continue
+            file = entry.name
             try:
-                with open(file_path, 'r') as f:
-                    content = hcl2.load(f)
-                    terraform_data[file] = content
-            except Exception as e:
-                # If parsing fails, create a fallback structure based on regex patterns
-                # This ensures we can show something in the UI even if HCL parser fails
-                terraform_data[file] = extract_fallback_structure(terraform_data[file + "_raw"])
-                # Log parsing error but don't let it break the TUI
-                print(f"Warning: Error parsing {file}: {str(e)}")
+                stat = entry.stat()
+                file_stamp = (os.path.abspath(entry.path), stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                file_stamp = None
+            stamps.append((file, file_stamp))
+            
+            # Files that have not changed reuse their cached content and parse result
+            if file_stamp is None or _file_mtimes.get(file) != file_stamp or file not in _parse_cache:
+                changed.append((file, entry.path))
     
-    return terraform_data
+    return stamps, {file: _parse_file(path) for file, path in changed}
+
+# Store a scan in the caches, on the thread that reads them
+def apply_terraform_scan(scan):
+    """
+    Update the caches with a scan_terraform_files result and return
+    (parsed, raw_contents, files) like parse_terraform_files.
+    """
+    stamps, parsed = scan
+    terraform_data = {}
+    raw_contents = {}
+    for file, file_stamp in stamps:
+        # Invalidate cached blocks if the file changed since it was last parsed
+        if _file_mtimes.get(file) != file_stamp:
+            _invalidate_file_caches(file)
+            _file_mtimes[file] = file_stamp
+        
+        if file in parsed:
+            content, raw, warning, digest = parsed[file]
+            if warning is not None:
+                # Log parsing error but don't let it break the TUI
+                print(f"Warning: Error parsing {file}: {warning}")
+            if content is not None:
+                _parse_cache[file] = (content, raw, digest)
+                _parsed_by_digest[digest] = (content, warning)
+        else:
+            content, raw = _parse_cache[file][:2]
+        raw_contents[file] = raw
+        if content is not None:
+            terraform_data[file] = content
+    
+    # Forget cached entries for files that no longer exist
+    seen = {file for file, _ in stamps}
+    for file in [file for file in _file_mtimes if file not in seen]:
+        _invalidate_file_caches(file)
+        del _file_mtimes[file]
+    
+    # Drop parses of content no file has any more
+    live = {entry[2] for entry in _parse_cache.values()}
+    for digest in [digest for digest in _parsed_by_digest if digest not in live]:
+        del _parsed_by_digest[digest]
+    
+    return terraform_data, raw_contents, list(terraform_data)
+
+# Parse .tf and .tfvars files
+def parse_terraform_files(directory):
+    """
+    Parse every .tf and .tfvars file in directory.
+    Returns (parsed, raw_contents, files): parsed content per file name, raw
+    text per file name, and the ordered list of files that have parsed content.
+    """
+    return apply_terraform_scan(scan_terraform_files(directory))
+
+# Run scan_terraform_files on a worker thread
+def parse_terraform_files_async(directory):
+    """Return a future resolving to the scan_terraform_files result for apply_terraform_scan"""
+    return _executor.submit(scan_terraform_files, directory)
 
 # Extract a basic structure even if HCL2 parsing fails
 def extract_fallback_structure(raw_content):
@@ -112,70 +347,164 @@ def extract_fallback_structure(raw_content):
     """
     structure = {}
     
-    # Common Terraform block types
-    block_patterns = [
-        r'resource\s+"([^"]+)"\s+"([^"]+)"',
-        r'data\s+"([^"]+)"\s+"([^"]+)"',
-        r'variable\s+"([^"]+)"',
-        r'output\s+"([^"]+)"',
-        r'provider\s+"?([^"\s{]+)"?',
-        r'module\s+"([^"]+)"',
-        r'locals\s+{',
-        r'terraform\s+{',
-    ]
-    
-    for pattern in block_patterns:
-        matches = re.finditer(pattern, raw_content)
-        for match in matches:
-            groups = match.groups()
-            if len(groups) == 2:  # resource or data block
-                block_type = match.group(0).split()[0]  # resource, data, etc.
-                resource_type = groups[0]
-                resource_name = groups[1]
-                
-                if block_type not in structure:
-                    structure[block_type] = {}
-                
-                if resource_type not in structure[block_type]:
-                    structure[block_type][resource_type] = {}
-                
-                structure[block_type][resource_type][resource_name] = {}
+    for match in _FALLBACK_RE.finditer(raw_content):
+        block_type = match.lastgroup
+        if block_type in ("resource", "data"):
+            resource_type = match.group(block_type + "_type")
+            resource_name = match.group(block_type + "_name")
             
-            elif len(groups) == 1:  # variable, output, module, provider
-                block_type = match.group(0).split()[0]  # variable, output, etc.
-                name = groups[0]
-                
-                if block_type not in structure:
-                    structure[block_type] = {}
-                
-                structure[block_type][name] = {}
+            if block_type not in structure:
+                structure[block_type] = {}
             
-            else:  # locals, terraform, or other blocks
-                block_type = match.group(0).split()[0]
-                if block_type not in structure:
-                    structure[block_type] = {}
-                
-                # For terraform blocks, try to detect required_providers
-                if block_type == "terraform":
-                    # Check if this looks like a terraform block with required_providers
-                    if "required_providers" in raw_content[match.start():match.start() + 200]:
-                        structure[block_type]["required_providers"] = {}
-                        
-                # For locals blocks, try to identify individual local variables
-                if block_type == "locals":
-                    # Try to extract local variable names
-                    locals_section = raw_content[match.start():match.start() + 500]  # Limit the search range
-                    # Find local variable definitions - look for patterns like name = value
-                    local_vars = re.findall(r'(\w+)\s*=\s*', locals_section)
-                    for var_name in local_vars:
-                        structure[block_type][var_name] = {}
+            if resource_type not in structure[block_type]:
+                structure[block_type][resource_type] = {}
+            
+            structure[block_type][resource_type][resource_name] = {}
+        
+        elif block_type in ("variable", "output", "module", "provider"):
+            name = match.group(block_type + "_name")
+            
+            if block_type not in structure:
+                structure[block_type] = {}
+            
+            structure[block_type][name] = {}
+        
+        else:  # locals or terraform
+            if block_type not in structure:
+                structure[block_type] = {}
+            
+            # For terraform blocks, try to detect required_providers
+            if block_type == "terraform":
+                # Check if this looks like a terraform block with required_providers
+                if "required_providers" in raw_content[match.start():match.start() + 200]:
+                    structure[block_type]["required_providers"] = {}
+                    
+            # For locals blocks, try to identify individual local variables
+            if block_type == "locals":
+                for var_name in _find_local_names(raw_content, match.end() - 1):
+                    structure[block_type][var_name] = {}
+    
+    # Keep the block types in the same order as the old one-pass-per-type scan
+    structure = {block_type: structure[block_type] for block_type in _FALLBACK_TYPES if block_type in structure}
     
     return structure
 
+# Find the span of a bracket-delimited block, jumping between brackets with str.find
+def _find_balanced_block(text, start, open='{', close='}'):
+    """
+    Return the (start, end) span of the block whose opening bracket is at
+    text[start], with end just past the matching closing bracket.
+    Returns None if the block is never closed.
+    """
+    bracket_count = 1
+    current_idx = start + 1
+    next_open = text.find(open, current_idx)
+    
+    # Find the matching closing bracket, skipping the text between brackets in C
+    while bracket_count:
+        next_close = text.find(close, current_idx)
+        if next_close == -1:
+            return None
+        if next_open != -1 and next_open < next_close:
+            bracket_count += 1
+            current_idx = next_open + 1
+            next_open = text.find(open, current_idx)
+        else:
+            bracket_count -= 1
+            current_idx = next_close + 1
+    
+    return start, current_idx
+
+# Find every `keyword { ... }` block (e.g. terraform, locals) in raw content
+def _find_keyword_blocks(text, keyword):
+    """Yield the (start, end) span of each balanced `keyword { ... }` block in text."""
+    pos = text.find(keyword)
+    while pos != -1:
+        # Skip whitespace between the keyword and its opening brace
+        brace_pos = pos + len(keyword)
+        while brace_pos < len(text) and text[brace_pos].isspace():
+            brace_pos += 1
+        
+        if brace_pos < len(text) and text[brace_pos] == '{':
+            span = _find_balanced_block(text, brace_pos)
+            if span:
+                yield pos, span[1]
+                pos = text.find(keyword, span[1])
+                continue
+        
+        pos = text.find(keyword, pos + 1)
+
+# List the top-level assignments of a locals block
+def _find_local_names(text, brace_pos):
+    """
+    Yield the names assigned directly inside the locals block whose opening
+    brace is at text[brace_pos], skipping keys of nested objects. An unclosed
+    block is scanned for 500 characters.
+    """
+    span = _find_balanced_block(text, brace_pos)
+    end = span[1] - 1 if span else min(len(text), brace_pos + 500)
+    
+    depth = 0
+    pos = brace_pos + 1
+    for match in _LOCAL_VAR_RE.finditer(text, pos, end):
+        # Track nesting between the previous assignment and this one
+        depth += text.count('{', pos, match.start()) - text.count('}', pos, match.start())
+        pos = match.start()
+        if depth == 0:
+            yield match.group(1)
+
+# Compile the header patterns for a block once and reuse them on later lookups
+@lru_cache(maxsize=256)
+def _compile_block_patterns(block_type, escaped_block_name):
+    """
+    Build the compiled header patterns used by extract_block_content for a block.
+    Returns a tuple of (header patterns, flexible fallback pattern).
+    """
+    # Define patterns for different block formats
+    patterns = [
+        # Resource with double quotes for both resource type and name
+        fr'{block_type}\s+"{escaped_block_name}"\s*{{',
+        # Resource with resource name in second position (e.g., resource "aws_s3_bucket" "bucket")
+        fr'{block_type}\s+["\'][^"\']+["\']\\s+"{escaped_block_name}"\s*{{',
+        # Provider or similar blocks without quotes
+        fr'{block_type}\s+{escaped_block_name}\s*{{',
+        # Variable or output with equals
+        fr'{block_type}\s+"{escaped_block_name}"\s*=',
+        # Variable without quotes with equals
+        fr'{block_type}\s+{escaped_block_name}\s*=',
+        # Single quote variants
+        fr"{block_type}\s+'{escaped_block_name}'\s*{{",
+        fr"{block_type}\s+'{escaped_block_name}'\s*="
+    ]
+    
+    # Special case for resource blocks where block_name might be the resource type
+    if block_type == "resource":
+        # Try to match any resource declaration that includes block_name
+        resource_patterns = [
+            fr'resource\s+"{escaped_block_name}"\s+"[^"]+"\s*{{',  # resource "aws_s3_bucket" "my-bucket"
+            fr'resource\s+"[^"]+"\s+"{escaped_block_name}"\s*{{'   # resource "aws_s3_bucket" "guide-tfe-es-s3"
+        ]
+        patterns.extend(resource_patterns)
+    
+    # A more flexible pattern for blocks that don't match the standard formats
+    flexible_pattern = re.compile(
+        fr'(?:^|\n)\s*{block_type}\s+(?:"[^"]*"\s+)?(?:"?{escaped_block_name}"?|\'?{escaped_block_name}\'?)',
+        re.MULTILINE)
+    
+    return tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in patterns), flexible_pattern
+
+# Compile the pattern that finds a variable assignment inside a locals block
+@lru_cache(maxsize=256)
+def _compile_local_var_pattern(block_name):
+    """Match "block_name" = ... or block_name = ... (with or without quotes)."""
+    return re.compile(fr'["\']?{re.escape(block_name)}["\']?\s*=')
+
 # Extract raw block content from file
-def extract_block_content(raw_content, block_type, block_name):
+def extract_block_span(raw_content, block_type, block_name):
     """
     Extract the content of a Terraform block from raw file content.
+    Returns (content, start, end) where raw_content[start:end] == content,
+    or (message, -1, -1) if the block could not be found.
     Handles various block formats including:
     1. Standard brace format: block_type "block_name" { ... }
     2. Equals format: block_type "block_name" = ...
@@ -189,108 +518,93 @@ def extract_block_content(raw_content, block_type, block_name):
         # If specifically looking for required_providers inside terraform block
         if block_name == "required_providers":
             # First find the terraform block
-            terraform_pattern = r'terraform\s*{(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*}'
-            terraform_match = re.search(terraform_pattern, raw_content, re.DOTALL)
-            if terraform_match:
-                terraform_content = terraform_match.group(0)
+            terraform_span = next(_find_keyword_blocks(raw_content, "terraform"), None)
+            if terraform_span:
+                terraform_content = raw_content[terraform_span[0]:terraform_span[1]]
                 # Now try to extract just the required_providers section
-                required_providers_pattern = r'required_providers\s*{(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*}'
-                required_match = re.search(required_providers_pattern, terraform_content, re.DOTALL)
-                if required_match:
+                required_span = next(_find_keyword_blocks(terraform_content, "required_providers"), None)
+                if required_span:
                     # Return just the required_providers block
-                    return required_match.group(0)
+                    start = terraform_span[0] + required_span[0]
+                    end = terraform_span[0] + required_span[1]
+                    return raw_content[start:end], start, end
                 # If we couldn't find the specific required_providers block, return the whole terraform block
-                return terraform_content
-            return "Block content not found"
+                return terraform_content, terraform_span[0], terraform_span[1]
+            return "Block content not found", -1, -1
         else:
             # Looking for the entire terraform block
-            terraform_pattern = r'terraform\s*{(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*}'
-            terraform_match = re.search(terraform_pattern, raw_content, re.DOTALL)
-            if terraform_match:
-                return terraform_match.group(0)
-            return "Block content not found"
+            terraform_span = next(_find_keyword_blocks(raw_content, "terraform"), None)
+            if terraform_span:
+                return raw_content[terraform_span[0]:terraform_span[1]], terraform_span[0], terraform_span[1]
+            return "Block content not found", -1, -1
     
     # Special handling for locals blocks
     if block_type == "locals":
-        locals_pattern = r'locals\s*{(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*}'
-        matches = list(re.finditer(locals_pattern, raw_content, re.DOTALL))
+        matches = [(raw_content[start:end], start, end) for start, end in _find_keyword_blocks(raw_content, "locals")]
         
         # If there's only one locals block or block_name is empty, return the first match
         if len(matches) == 1 or not block_name:
             if matches:
-                return matches[0].group(0)
-            return "Block content not found"
+                return matches[0]
+            return "Block content not found", -1, -1
         
         # If we have a specific locals block name, try to find it
         # In this case, block_name might be a variable defined in locals
+        var_pattern = _compile_local_var_pattern(block_name)
         for match in matches:
-            locals_content = match.group(0)
             # Look for the specific variable in the locals block
-            # Match "block_name" = ... or block_name = ... (with or without quotes)
-            var_pattern = fr'["\']?{re.escape(block_name)}["\']?\s*='
-            if re.search(var_pattern, locals_content):
-                return locals_content
+            if var_pattern.search(match[0]):
+                return match
         
         # If we can't find a specific match, return the first one
         if matches:
-            return matches[0].group(0)
-        return "Block content not found"
+            return matches[0]
+        return "Block content not found", -1, -1
     
     # Escape quotes in block_name if they exist
     escaped_block_name = block_name
     if '"' in block_name:
         escaped_block_name = block_name.replace('"', '\\"')
     
-    # Define patterns for different block formats
-    patterns = [
-        # Resource with double quotes for both resource type and name
-        fr'{block_type}\s+"{escaped_block_name}"\s*{{',
-        # Resource with resource name in second position (e.g., resource "aws_s3_bucket" "bucket")
-        fr'{block_type}\s+["\'][^"\']+["\']\\s+"{escaped_block_name}"\s*{{',
-        # Provider or similar blocks without quotes
-        fr'{block_type}\s+{escaped_block_name}\s*{{',
-        # Variable or output with equals
-        fr'{block_type}\s+"{escaped_block_name}"\s*=',
-        # Variable without quotes with equals
-        fr'{block_type}\s+{escaped_block_name}\s*=',
-        # Single quote variants
-        fr"{block_type}\s+'{escaped_block_name}'\s*{{",
-        fr"{block_type}\s+'{escaped_block_name}'\s*="
-    ]
-    
-    # Special case for resource blocks where block_name might be the resource type
-    if block_type == "resource":
-        # Try to match any resource declaration that includes block_name
-        resource_patterns = [
-            fr'resource\s+"{escaped_block_name}"\s+"[^"]+"\s*{{',  # resource "aws_s3_bucket" "my-bucket"
-            fr'resource\s+"[^"]+"\s+"{escaped_block_name}"\s*{{'   # resource "aws_s3_bucket" "guide-tfe-es-s3"
-        ]
-        patterns.extend(resource_patterns)
+    # Fetch the (cached) compiled patterns for this block
+    patterns, flexible_pattern = _compile_block_patterns(block_type, escaped_block_name)
     
     start_idx = -1
     matched_pattern = None
-    matched_text = None
     
-    # Try each pattern
-    for pattern in patterns:
-        matches = list(re.finditer(pattern, raw_content, re.MULTILINE | re.DOTALL))
-        for match in matches:
-            # If we find multiple matches, we need to figure out the right one
-            # For now, take the first match, but this could be improved
-            potential_start = match.start()
-            matched_text = match.group(0)
-            
-            # If we already found a match earlier in the file, keep that one
-            if start_idx == -1 or potential_start < start_idx:
-                start_idx = potential_start
-                matched_pattern = pattern
-                matched_text = match.group(0)
+    # Fast path: most headers are written exactly as `type "name"` or `type name`,
+    # so look for them with str.find and only confirm the header with the patterns
+    # anchored at that position
+    for probe in (f'{block_type} "{block_name}"', f'{block_type} {block_name}'):
+        potential_start = raw_content.find(probe)
+        if potential_start != -1 and (start_idx == -1 or potential_start < start_idx):
+            for pattern in patterns:
+                if pattern.match(raw_content, potential_start):
+                    start_idx = potential_start
+                    matched_pattern = pattern.pattern
+                    break
+    
+    # The probe only wins if no header form starts earlier in the file. Every
+    # pattern starts with block_type, so only its earlier occurrences can match
+    pos = raw_content.find(block_type, 0, start_idx)
+    while start_idx != -1 and pos != -1:
+        if any(pattern.match(raw_content, pos) for pattern in patterns):
+            start_idx = -1
+        else:
+            pos = raw_content.find(block_type, pos + 1, start_idx)
+    
+    # Otherwise try each pattern and keep the earliest match in the file
+    if start_idx == -1:
+        for pattern in patterns:
+            match = pattern.search(raw_content)
+            if match and (start_idx == -1 or match.start() < start_idx):
+                start_idx = match.start()
+                matched_pattern = pattern.pattern
     
     if start_idx == -1:
         # Try a more flexible approach for blocks that might not match standard patterns
         # This is especially useful for resource blocks which have a more complex structure
-        flexible_pattern = fr'(?:^|\n)\s*{block_type}\s+(?:"[^"]*"\s+)?(?:"?{escaped_block_name}"?|\'?{escaped_block_name}\'?)'
-        match = re.search(flexible_pattern, raw_content, re.MULTILINE)
+        match = flexible_pattern.search(raw_content)
         if match:
             # Found a match with more flexible pattern
             start_idx = match.start()
@@ -306,7 +620,7 @@ def extract_block_content(raw_content, block_type, block_name):
                     matched_pattern = '{'  # This is a braced block
         
         if start_idx == -1:
-            return "Block content not found"
+            return "Block content not found", -1, -1
     
     # Determine if this is an equals-style block or brace-style block
     is_equals_block = matched_pattern and ('=' in matched_pattern or matched_pattern == '=')
@@ -316,11 +630,10 @@ def extract_block_content(raw_content, block_type, block_name):
         # Find the equals sign
         eq_pos = raw_content.find('=', start_idx)
         if eq_pos == -1:
-            return "Block content not found (equals sign expected)"
+            return "Block content not found (equals sign expected)", -1, -1
         
         # Look for either the next block definition or EOF
-        block_pattern = r'(?:^|\n)\s*(resource|provider|variable|output|locals|module|data)\s+'
-        next_match = re.search(block_pattern, raw_content[eq_pos:], re.MULTILINE)
+        next_match = _NEXT_BLOCK_RE.search(raw_content[eq_pos:])
         
         if next_match:
             end_idx = eq_pos + next_match.start()
@@ -331,45 +644,214 @@ def extract_block_content(raw_content, block_type, block_name):
         else:
             end_idx = len(raw_content)
             
-        # Clean up the content to handle EOF case properly
-        content = raw_content[start_idx:end_idx].strip()
-        return content
+        # Clean up the content to handle EOF case properly, keeping the
+        # offsets in step with the stripped content
+        content = raw_content[start_idx:end_idx]
+        stripped = content.strip()
+        start_idx += len(content) - len(content.lstrip())
+        end_idx = start_idx + len(stripped)
+        return stripped, start_idx, end_idx
     
     # For brace-style blocks
     # Find the opening brace
-    open_brace_pos = -1
-    for i in range(start_idx, min(start_idx + 200, len(raw_content))):
-        if raw_content[i] == '{':
-            open_brace_pos = i
-            break
+    open_brace_pos = raw_content.find('{', start_idx, start_idx + 200)
     
     if open_brace_pos == -1:
-        return "Block content not found (no opening brace)"
+        return "Block content not found (no opening brace)", -1, -1
         
     # Count brackets to find matching closing brace
-    bracket_count = 1
-    current_idx = open_brace_pos
-    
-    # Find the matching closing bracket
-    while bracket_count > 0 and current_idx < len(raw_content) - 1:
-        current_idx += 1
-        if raw_content[current_idx] == '{':
-            bracket_count += 1
-        elif raw_content[current_idx] == '}':
-            bracket_count -= 1
-    
-    if bracket_count == 0:
+    span = _find_balanced_block(raw_content, open_brace_pos)
+    if span:
         # Found a matching closing bracket
-        end_idx = current_idx + 1
-        return raw_content[start_idx:end_idx]
+        end_idx = span[1]
+        return raw_content[start_idx:end_idx], start_idx, end_idx
     
-    return "Block content not found (incomplete block)"
+    return "Block content not found (incomplete block)", -1, -1
+
+# Extract just the text of a Terraform block
+def extract_block_content(raw_content, block_type, block_name):
+    """Return the content of a Terraform block, see extract_block_span."""
+    return extract_block_span(raw_content, block_type, block_name)[0]
+
+# Walk the blocks of a parsed file, whose block types map to either a dict of
+# names or (as hcl2 returns them) a list of dicts
+def iter_blocks(file_content):
+    """Yield (block_type, name) for every block of a file, in file order."""
+    if not isinstance(file_content, dict):
+        return
+    for block_type, block_items in file_content.items():
+        if isinstance(block_items, dict):
+            for name in block_items:
+                yield block_type, name
+        elif isinstance(block_items, list):
+            for item in block_items:
+                if isinstance(item, dict):
+                    for name in item:
+                        yield block_type, name
+
+# List the blocks of a parsed file as (block_type, name, lookup_name) tuples.
+# lookup_name is the name passed to extract_block_content: resource names have
+# their quotes stripped here once instead of on every redraw.
+def _enumerate_blocks(file_content):
+    blocks = []
+    for block_type, name in iter_blocks(file_content):
+        lookup_name = name.replace('"', '') if block_type == "resource" else name
+        blocks.append((block_type, name, lookup_name))
+    return blocks
+
+# Look up the blocks of a file, building the list once per file version
+def get_file_blocks(file_name, file_content):
+    """Return the (block_type, name, lookup_name) entries of a file, reusing the cached list."""
+    blocks = _blocks_by_file.get(file_name)
+    if blocks is None:
+        blocks = _enumerate_blocks(file_content)
+        _blocks_by_file[file_name] = blocks
+    return blocks
+
+# Find a block in a file's block list without scanning it
+def get_block_position(file_name, file_content, block_type, block_name):
+    """Return the index of the first (block_type, block_name) entry of a file, or -1."""
+    positions = _block_positions.get(file_name)
+    if positions is None:
+        positions = {}
+        for index, (bt, bn, _) in enumerate(get_file_blocks(file_name, file_content)):
+            positions.setdefault((bt, bn), index)
+        _block_positions[file_name] = positions
+    return positions.get((block_type, block_name), -1)
+
+# Find a file in the file list, rebuilding the index only when the list is replaced
+def get_file_position(files, file_name):
+    """Return the index of file_name in files, or -1."""
+    global _file_positions
+    if _file_positions[0] is not files:
+        _file_positions = (files, {file: index for index, file in reversed(list(enumerate(files)))})
+    return _file_positions[1].get(file_name, -1)
+
+# Index the items of every category as "file:name" entries, in file order
+def _build_category_index(data):
+    index = {}
+    for file, content in data.items():
+        if not isinstance(content, dict):
+            continue
+        for category, item_name in iter_blocks(content):
+            index.setdefault(category, []).append(f"{file}:{item_name}")
+    return index
+
+# Look up the items of a category, rebuilding the index only when the data is reloaded
+def get_category_items(data, category):
+    """Return the "file:name" entries of a category. The returned list is shared, do not modify it."""
+    global _category_index
+    if _category_index[0] is not data:
+        _category_index = (data, _build_category_index(data))
+    return _category_index[1].get(category, [])
+
+# Index the files that define modules and the module names of each one
+def _build_module_index(data, files):
+    files_with_modules = []
+    modules_by_file = {}
+    for file in files:
+        file_content = data.get(file, {})
+        if not has_modules(file_content):
+            continue
+        modules = []
+        if isinstance(file_content['module'], dict):
+            modules = list(file_content['module'].keys())
+        elif isinstance(file_content['module'], list):
+            for item in file_content['module']:
+                if isinstance(item, dict):
+                    modules.extend(item.keys())
+        files_with_modules.append(file)
+        modules_by_file[file] = tuple(modules)
+    return tuple(files_with_modules), modules_by_file
+
+# Look up the module index, rebuilding it only when the data is reloaded
+def _get_module_index(data, files):
+    global _module_index
+    if _module_index[0] is not data or _module_index[1] is not files:
+        _module_index = (data, files) + _build_module_index(data, files)
+    return _module_index[2], _module_index[3]
+
+# Files that define at least one module, in the order of files
+def get_files_with_modules(data, files):
+    """Return a tuple of the files with a non-empty module block."""
+    return _get_module_index(data, files)[0]
+
+# Module names defined in a file
+def get_file_modules(data, files, file):
+    """Return a tuple of the module names defined in file, empty if it has none."""
+    return _get_module_index(data, files)[1].get(file, ())
+
+# Entries of the first column of a view: files, categories or files with modules
+def get_view_items(view, data, files):
+    """Return the first-column entries of view, served from the cached indexes."""
+    if view == 2:
+        return _CATEGORIES
+    if view == 3:
+        return get_files_with_modules(data, files)
+    return files
+
+# Entries of the second column of a view for the selected first-column entry
+def get_view_blocks(view, data, files, selected_index):
+    """
+    Return the second-column entries of view: the blocks of the selected file,
+    the "file:name" items of the selected category or the modules of the
+    selected file. Empty if nothing is selected.
+    """
+    items = get_view_items(view, data, files)
+    if not 0 <= selected_index < len(items):
+        return ()
+    if view == 2:
+        return get_category_items(data, items[selected_index])
+    if view == 3:
+        return get_file_modules(data, files, items[selected_index])
+    return get_file_blocks(items[selected_index], data.get(items[selected_index], {}))
+
+# The entry selected in the second column of a view, resolved to the block it shows
+def get_view_selection(view, data, files, selected_index, selected_block_index):
+    """
+    Return (file, block_type, block_name) of the selected second-column entry
+    of view, with block_name as extract_block_content expects it, or None if
+    no entry is selected.
+    """
+    blocks = get_view_blocks(view, data, files, selected_index)
+    if not 0 <= selected_block_index < len(blocks):
+        return None
+    entry = blocks[selected_block_index]
+    if view == 2:
+        # Category items already name the file that defines them
+        file, _, item_name = entry.partition(":")
+        return file, _CATEGORIES[selected_index], item_name
+    if view == 3:
+        return get_view_items(view, data, files)[selected_index], "module", entry
+    # Resource names already have their quotes stripped in lookup_name
+    block_type, _, lookup_name = entry
+    return get_view_items(view, data, files)[selected_index], block_type, lookup_name
+
+# Look up a block's span, extracting it only on the first request, since the
+# views, search, save and edit keep asking for the same blocks
+def get_cached_block_span(file_name, raw_content, block_type, block_name):
+    """Return extract_block_span for a block of a file, reusing earlier results."""
+    key = (file_name, block_type, block_name)
+    span = _block_cache.pop(key, None)
+    if span is None:
+        span = extract_block_span(raw_content, block_type, block_name)
+        # Evict the least recently used block once the cache is full
+        if len(_block_cache) >= _CACHE_SIZE:
+            del _block_cache[next(iter(_block_cache))]
+    _block_cache[key] = span  # (Re)insert as the most recently used
+    return span
+
+# Look up a block's raw content, extracting it only on the first request
+def get_cached_block_content(file_name, raw_content, block_type, block_name):
+    """Return extract_block_content for a block of a file, reusing earlier results."""
+    return get_cached_block_span(file_name, raw_content, block_type, block_name)[0]
 
 # Function to edit content in an external editor and save changes
-def edit_block_content(file_path, block_type, block_name, block_content):
+def edit_block_content(file_path, block_type, block_name, block_content, start=-1, end=-1):
     """
     Edit a block of Terraform code in an external editor.
     This function is designed to properly handle the terminal state transitions.
+    start and end are the block's offsets in the file, as returned by extract_block_span.
     """
     # Ensure file_path is absolute
     if not os.path.isabs(file_path):
@@ -377,10 +859,11 @@ def edit_block_content(file_path, block_type, block_name, block_content):
     
     # Create a temporary file with the block content
     try:
-        with tempfile.NamedTemporaryFile(suffix='.tf', mode='w', delete=False) as temp_file:
-            temp_file_path = temp_file.name
-            temp_file.write(block_content)
-            temp_file.flush()  # Make sure all data is written
+        fd, temp_file_path = tempfile.mkstemp(suffix='.tf')
+        try:
+            os.write(fd, block_content.encode('utf-8'))
+        finally:
+            os.close(fd)
     except Exception as e:
         return False, f"Failed to create temp file: {str(e)}"
 
@@ -392,7 +875,8 @@ def edit_block_content(file_path, block_type, block_name, block_content):
         # before this function is called, so terminal should be in normal mode
         
         # Print clear instructions for the user
-        os.system('clear')  # Clear screen for better UX
+        sys.stdout.write(_CLEAR)  # Clear screen for better UX
+        sys.stdout.flush()
         print("\n\n==== EDITING TERRAFORM BLOCK ====")
         print(f"File: {os.path.basename(file_path)}")
         print(f"Block: {block_type}.{block_name}")
@@ -405,16 +889,21 @@ def edit_block_content(file_path, block_type, block_name, block_content):
         
         # Read the edited content
         try:
-            with open(temp_file_path, 'r') as temp_file:
+            with open(temp_file_path, 'r', encoding='utf-8') as temp_file:
                 edited_content = temp_file.read()
             
             # Read the original file content
             with open(file_path, 'r') as f:
                 original_content = f.read()
             
-            # Replace the block content in the original file
-            if block_content in original_content:
-                new_content = original_content.replace(block_content, edited_content)
+            # Splice the edited block in at its original offsets. If the file changed
+            # on disk since it was parsed, fall back to locating the block once.
+            if start == -1 or original_content[start:end] != block_content:
+                start = original_content.find(block_content)
+                end = start + len(block_content)
+            
+            if start != -1:
+                new_content = original_content[:start] + edited_content + original_content[end:]
                 
                 # Write the updated content back to the file
                 with open(file_path, 'w') as f:
@@ -436,7 +925,8 @@ def edit_block_content(file_path, block_type, block_name, block_content):
             pass
         
         # Clear the screen again before returning to curses
-        os.system('clear')
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
         
         return success, message
             
@@ -459,49 +949,160 @@ def apply_syntax_highlighting(code):
     # without embedding color markers in the text
     return code
 
-# Views
-def file_view(stdscr, data, selected_index, selected_block_index, file_scroll_offset=0, block_scroll_offset=0, content_scroll_offset=0, wrap_lines=True):
-    height, width = stdscr.getmaxyx()
-    
-    # Define column widths
+# Split block content into display lines, cached per (content, width, wrap)
+@lru_cache(maxsize=64)
+def _wrap_lines(content, width, wrap):
+    """
+    Split content into lines, wrapping each line by characters (not words,
+    for simplicity and reliability) to width when wrap is set.
+    Returns a tuple so the cached result can be shared between redraws.
+    """
+    lines = content.split('\n')
+    if not wrap:
+        return tuple(lines)
+    
+    # Guard against a zero or negative width on very narrow terminals
+    width = max(1, width)
+    wrapped_lines = []
+    for line in lines:
+        # If the line is shorter than the column width, add it as is
+        if len(line) <= width:
+            wrapped_lines.append(line)
+        else:
+            wrapped_lines.extend([line[i:i + width] for i in range(0, len(line), width)])
+    return tuple(wrapped_lines)
+
+# Column widths, border line and empty cells for a terminal width, cached so
+# they are only rebuilt when the terminal is resized
+@lru_cache(maxsize=8)
+def _row_templates(width):
+    """
+    Return (border_line, (empty_col1, empty_col2, empty_col3), empty_row, (col1_width, col2_width, col3_width))
+    for the three-column layout shared by all views. empty_row paints a row that
+    is empty in all three columns with a single addstr at x=1.
+    """
     col1_width = max(20, width // 4)
     col2_width = max(20, width // 4)
     col3_width = width - col1_width - col2_width - 4
+    border_line = "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+"
+    empty_cols = ("|" + " "*(col1_width-2) + "|",
+                  "|" + " "*(col2_width-2) + "|",
+                  "|" + " "*(col3_width-2) + "|")
+    # The first column's closing "|" is shared with the second column's opening one
+    empty_row = empty_cols[0][:-1] + empty_cols[1] + empty_cols[2]
+    return border_line, empty_cols, empty_row, (col1_width, col2_width, col3_width)
+
+# Header row for the three columns, cached so it is only rebuilt when the
+# terminal is resized or a header changes
+@lru_cache(maxsize=64)
+def _header_row(width, col1_header, col2_header, col3_header):
+    """Return the padded header row, truncating headers too long for their column."""
+    _, _, _, (col1_width, col2_width, col3_width) = _row_templates(width)
+    if len(col2_header) > col2_width - 4:
+        col2_header = col2_header[:col2_width - 7] + "..."
+    if len(col3_header) > col3_width - 4:
+        col3_header = col3_header[:col3_width - 7] + "..."
+    return ("| " + col1_header.ljust(col1_width-4) + " | " +
+            col2_header.ljust(col2_width-4) + " | " +
+            col3_header.ljust(col3_width-4) + " |")
+
+# Draw the body rows of the three columns, merging each row into as few addstr calls as possible
+def _draw_rows(stdscr, width, start_row, max_rows, col1_cells, col2_cells, col3_cells):
+    """
+    Draw max_rows rows from the cells of each column, where a cell is a tuple of
+    (text, attr) runs and columns with fewer cells are padded with empty cells.
+    Adjacent runs with the same attribute are joined, so a row without a
+    selected or highlighted cell is drawn with a single addstr.
+    """
+    _, (empty_col1, empty_col2, empty_col3), empty_row, _ = _row_templates(width)
+    # Leave the first column's closing "|" to the second column, which may draw it reversed
+    empty_cells = (((empty_col1[:-1], curses.A_NORMAL),),
+                   ((empty_col2, curses.A_NORMAL),),
+                   ((empty_col3, curses.A_NORMAL),))
+    col1_rows, col2_rows, col3_rows = len(col1_cells), len(col2_cells), len(col3_cells)
+    # Bound once instead of looked up for every row
+    addstr = stdscr.addstr
+    
+    for i in range(max_rows):
+        row = start_row + i
+        if i >= col1_rows and i >= col2_rows and i >= col3_rows:
+            addstr(row, 1, empty_row)
+            continue
+        
+        runs = ((col1_cells[i] if i < col1_rows else empty_cells[0]) +
+                (col2_cells[i] if i < col2_rows else empty_cells[1]) +
+                (col3_cells[i] if i < col3_rows else empty_cells[2]))
+        try:
+            x = 1
+            text, attr = runs[0]
+            for run_text, run_attr in runs[1:]:
+                if run_attr == attr:
+                    text += run_text
+                    continue
+                addstr(row, x, text, attr)
+                x += len(text)
+                text, attr = run_text, run_attr
+            addstr(row, x, text, attr)
+        except curses.error:
+            # This can happen if we try to write to the bottom-right corner
+            pass
+
+# Classify a line of block content for syntax highlighting
+@lru_cache(maxsize=4096)
+def _classify(line):
+    """
+    Return the color pair number for a line: 4 for comments, 1 for keywords,
+    2 for lines with quotes, 3 for assignments and 0 otherwise.
+    """
+    match = _HL_RE.match(line)
+    if match:
+        # Magenta for comments, green for keywords
+        return 4 if match.lastgroup == 'comment' else 1
+    if '"' in line or "'" in line:
+        return 2  # Yellow for strings
+    if line.find('=') != -1:
+        return 3  # Cyan for assignments
+    return 0
+
+# Pick the highlighting attribute for a single line of block content
+def get_line_attr(line):
+    """Return the curses attribute for a line, as classified by _classify."""
+    return _LINE_ATTRS[_classify(line)]
+
+# Content column cells for the visible lines
+def _content_cells(lines, first, count, col3_width):
+    """
+    Return the (text, attr) runs of the content column for lines[first:first + count],
+    where lines is the cached tuple from _wrap_lines.
+    """
+    return [(("| ", curses.A_NORMAL), (line.ljust(col3_width-4) + " ", get_line_attr(line)))
+            for line in lines[first:first + count]]
+
+# Views
+def file_view(stdscr, data, raw_contents, files, selected_index, selected_block_index, file_scroll_offset=0, block_scroll_offset=0, content_scroll_offset=0, wrap_lines=True):
+    height, width = stdscr.getmaxyx()
     
-    # Get the list of files
-    files = list(data.keys())
-    # Filter out raw content files
-    files = [f for f in files if not f.endswith("_raw")]
+    # Column widths, borders and empty cells, cached per terminal width
+    border_line, _, _, (col1_width, col2_width, col3_width) = _row_templates(width)
     
-    # Get the selected file name for dynamic headers
+    # Get the selected file name, its raw content and its blocks once per redraw
     selected_file_name = ""
+    raw_content = ""
+    blocks = []
     if 0 <= selected_index < len(files):
         selected_file_name = files[selected_index]
+        raw_content = raw_contents.get(selected_file_name, "")
+        blocks = get_file_blocks(selected_file_name, data.get(selected_file_name, {}))
     
     # Get selected block name for dynamic headers
     selected_block_name = ""
-    if selected_index < len(files) and selected_block_index >= 0:
-        selected_file = files[selected_index]
-        file_content = data.get(selected_file, {})
-        
-        blocks = []
-        if isinstance(file_content, dict):
-            for block_type, block_items in file_content.items():
-                if isinstance(block_items, list):
-                    for item in block_items:
-                        if isinstance(item, dict):
-                            for name in item.keys():
-                                blocks.append(f"{block_type}.{name}")
-                elif isinstance(block_items, dict):
-                    for name in block_items.keys():
-                        blocks.append(f"{block_type}.{name}")
-        
-        if 0 <= selected_block_index < len(blocks):
-            selected_block_name = blocks[selected_block_index]
+    if 0 <= selected_block_index < len(blocks):
+        block_type, block_name, _ = blocks[selected_block_index]
+        selected_block_name = f"{block_type}.{block_name}"
     
     # Draw column headers with borders and dynamic content
     header_y = 1
-    stdscr.addstr(header_y, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(header_y, 1, border_line)
     header_y += 1
     
     # First column header is always "Files"
@@ -516,17 +1117,9 @@ def file_view(stdscr, data, selected_index, selected_block_index, file_scroll_of
     else:
         col3_header = "Raw Block Content"
     
-    # Truncate headers if they're too long
-    if len(col2_header) > col2_width - 4:
-        col2_header = col2_header[:col2_width - 7] + "..."
-    if len(col3_header) > col3_width - 4:
-        col3_header = col3_header[:col3_width - 7] + "..."
-    
-    stdscr.addstr(header_y, 1, "| " + col1_header.ljust(col1_width-4) + " | " + 
-                  col2_header.ljust(col2_width-4) + " | " + 
-                  col3_header.ljust(col3_width-4) + " |")
+    stdscr.addstr(header_y, 1, _header_row(width, col1_header, col2_header, col3_header))
     header_y += 1
-    stdscr.addstr(header_y, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(header_y, 1, border_line)
     
     # Start row for content
     start_row = header_y + 1
@@ -534,54 +1127,33 @@ def file_view(stdscr, data, selected_index, selected_block_index, file_scroll_of
     # Calculate max visible rows for content
     max_rows = height - start_row - 2
     
-    # Display file list (first column) with scrolling
+    # Cells of the file list (first column) with scrolling
     visible_files = files[file_scroll_offset:file_scroll_offset + max_rows]
+    col1_cells = []
+    # Cell attributes, bound once for the loops over both list columns
+    reverse, normal = curses.A_REVERSE, curses.A_NORMAL
     for i, file in enumerate(visible_files):
-        row = start_row + i
         is_selected = i + file_scroll_offset == selected_index
         
+        # Build the cell up to the column separator so each attribute run is one string
         if is_selected:
-            stdscr.addstr(row, 1, "| " + ("> " + file).ljust(col1_width-4) + " ", curses.A_REVERSE)
+            cell = ("| " + ("> " + file).ljust(col1_width-4) + " ")[:col1_width-2]
+            col1_cells.append(((cell, reverse), ("|", normal)))
         else:
-            stdscr.addstr(row, 1, "| " + ("  " + file).ljust(col1_width-4) + " ")
-        
-        # Draw column separators
-        stdscr.addstr(row, col1_width-1, "|")
-    
-    # Fill remaining rows in first column
-    for i in range(len(visible_files), max_rows):
-        row = start_row + i
-        stdscr.addstr(row, 1, "|" + " "*(col1_width-2) + "|")
-    
-    # Display scroll indicators for files if needed
-    if file_scroll_offset > 0:
-        stdscr.addstr(start_row, col1_width-3, "↑")
-    if file_scroll_offset + max_rows < len(files):
-        stdscr.addstr(start_row + max_rows - 1, col1_width-3, "↓")
-    
-    # Display blocks of selected file (second column) with scrolling
-    blocks = []
-    if selected_index < len(files):
-        selected_file = files[selected_index]
-        file_content = data.get(selected_file, {})
-        
-        if isinstance(file_content, dict):
-            for block_type, block_items in file_content.items():
-                if isinstance(block_items, list):
-                    for item in block_items:
-                        if isinstance(item, dict):
-                            for name in item.keys():
-                                blocks.append(f"{block_type}.{name}")
-                elif isinstance(block_items, dict):
-                    for name in block_items.keys():
-                        blocks.append(f"{block_type}.{name}")
-        
+            cell = ("| " + ("  " + file).ljust(col1_width-4) + " ")[:col1_width-2]
+            col1_cells.append(((cell + "|", normal),))
+    
+    # Cells of the blocks of the selected file (second column) with scrolling
+    col2_cells = []
+    col3_cells = ()
+    lines = ()
+    if selected_file_name:
         # Apply block scrolling
         visible_blocks = blocks[block_scroll_offset:block_scroll_offset + max_rows]
         
-        for i, block in enumerate(visible_blocks):
-            row = start_row + i
+        for i, (block_type, block_name, _) in enumerate(visible_blocks):
             is_selected = i + block_scroll_offset == selected_block_index
+            block = f"{block_type}.{block_name}"
             
             # Handle line wrapping in block column
             if wrap_lines and len(block) > col2_width - 4:
@@ -589,176 +1161,53 @@ def file_view(stdscr, data, selected_index, selected_block_index, file_scroll_of
             else:
                 display_block = block
                 
+            cell = ("| " + display_block.ljust(col2_width-4) + " ")[:col2_width-1]
             if is_selected:
-                stdscr.addstr(row, col1_width, "| " + display_block.ljust(col2_width-4) + " ", curses.A_REVERSE)
+                col2_cells.append(((cell, reverse), ("|", normal)))
             else:
-                stdscr.addstr(row, col1_width, "| " + display_block.ljust(col2_width-4) + " ")
-            
-            # Draw column separators
-            stdscr.addstr(row, col1_width+col2_width-1, "|")
-        
-        # Fill remaining rows in second column
-        for i in range(len(visible_blocks), max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width, "|" + " "*(col2_width-2) + "|")
-        
-        # Display scroll indicators for blocks if needed
-        if block_scroll_offset > 0:
-            stdscr.addstr(start_row, col1_width+col2_width-3, "↑")
-        if block_scroll_offset + max_rows < len(blocks):
-            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width-3, "↓")
+                col2_cells.append(((cell + "|", normal),))
         
-        # Display raw content of selected block (third column) with scrolling and optional wrapping
+        # Raw content of selected block (third column) with scrolling and optional wrapping
         if 0 <= selected_block_index < len(blocks):
-            block = blocks[selected_block_index]
-            parts = block.split('.', 1)
-            if len(parts) == 2:
-                block_type, block_name = parts
-                
-                # Get raw file content
-                raw_content = data.get(selected_file + "_raw", "")
-                
-                # Special handling for resource blocks - both parts can contain quotes
-                if block_type == "resource" and '"' in block_name:
-                    # The block_name may contain both the resource type and name
-                    # For example: resource."aws_s3_bucket"."guide-tfe-es-s3"
-                    if '"' in block_name:
-                        # Remove quotes and extract the actual block name
-                        block_name = block_name.replace('"', '')
-                
-                # Find and display the block content
-                block_content = extract_block_content(raw_content, block_type, block_name)
-                
-                # Apply syntax highlighting to the block content
-                highlighted_content = apply_syntax_highlighting(block_content)
-                
-                # Display block content with scrolling, handling line breaks and wrapping
-                lines = highlighted_content.split('\n')
-                wrapped_lines = []
-                
-                if wrap_lines:
-                    # With line wrapping: Process each line to fit within column width
-                    for line in lines:
-                        # If the line is shorter than the column width, add it as is
-                        if len(line) <= col3_width - 6:  # -6 to account for margin and padding
-                            wrapped_lines.append(line)
-                        else:
-                            # Wrap the line by characters (not words, for simplicity and reliability)
-                            start = 0
-                            while start < len(line):
-                                end = min(start + col3_width - 6, len(line))
-                                wrapped_lines.append(line[start:end])
-                                start = end
-                    # Use wrapped lines for display
-                    lines = wrapped_lines
-                # else: use the original lines without wrapping
-                
-                # Display the visible portion of the content
-                visible_lines = lines[content_scroll_offset:content_scroll_offset + max_rows]
-                
-                for i, line in enumerate(visible_lines):
-                    row = start_row + i
-                    
-                    # Apply real-time syntax highlighting
-                    # First, display the base line with normal attributes
-                    try:
-                        stdscr.addstr(row, col1_width+col2_width, "| ", curses.A_NORMAL)
-                        
-                        # Now check and colorize line parts
-                        stripped_line = line.strip()
-                        display_line = line
-                        
-                        # Set default attribute
-                        attr = curses.A_NORMAL
-                        
-                        # Apply syntax highlighting based on pattern matching
-                        # Comments
-                        if stripped_line.startswith('#') and curses.has_colors():
-                            attr = curses.color_pair(4)  # Magenta for comments
-                        # Keywords at beginning of line
-                        elif (any(stripped_line.startswith(k + " ") for k in ['resource', 'variable', 'provider', 'module', 'data', 'output', 'locals', 'terraform'])
-                              and curses.has_colors()):
-                            attr = curses.color_pair(1)  # Green for keywords
-                        # Lines with quotes - likely strings
-                        elif ('"' in stripped_line or "'" in stripped_line) and curses.has_colors():
-                            # Only highlight if quotes are balanced - otherwise might be a mistake
-                            double_quotes = stripped_line.count('"') % 2 == 0
-                            single_quotes = stripped_line.count("'") % 2 == 0
-                            if double_quotes or single_quotes:
-                                attr = curses.color_pair(2)  # Yellow for strings
-                        # Special patterns
-                        elif "=" in stripped_line and curses.has_colors():
-                            attr = curses.color_pair(3)  # Cyan for assignments
-                            
-                        # Add the line with highlighting
-                        stdscr.addstr(display_line.ljust(col3_width-4) + " ", attr)
-                        
-                    except curses.error:
-                        # This can happen if we try to write to the bottom-right corner
-                        pass
-                
-                # Display scroll indicators for content if needed
-                if content_scroll_offset > 0:
-                    stdscr.addstr(start_row, col1_width+col2_width+col3_width-3, "↑")
-                if content_scroll_offset + max_rows < len(lines):
-                    stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width+col3_width-3, "↓")
-            else:
-                stdscr.addstr(start_row, col1_width+col2_width, "| Invalid block format" + " "*(col3_width-20) + " ")
-        
-        # Fill remaining rows in third column
-        empty_start = 0
-        if 0 <= selected_block_index < len(blocks):
-            block = blocks[selected_block_index]
-            parts = block.split('.', 1)
-            if len(parts) == 2:
-                raw_content = data.get(selected_file + "_raw", "")
-                block_type, block_name = parts
-                
-                # Special handling for resource blocks as above
-                if block_type == "resource" and '"' in block_name:
-                    block_name = block_name.replace('"', '')
-                    
-                block_content = extract_block_content(raw_content, block_type, block_name)
-                # Calculate the number of lines if wrapping is enabled
-                if wrap_lines:
-                    lines = []
-                    for original_line in block_content.split('\n'):
-                        if len(original_line) <= col3_width - 4:
-                            lines.append(original_line)
-                        else:
-                            # Simple word-wrap for estimation
-                            words = original_line.split(' ')
-                            current_line = ""
-                            for word in words:
-                                if len(current_line) + len(word) + 1 <= col3_width - 4:
-                                    current_line += (word + ' ')
-                                else:
-                                    lines.append(current_line)
-                                    current_line = word + ' '
-                            if current_line:
-                                lines.append(current_line)
-                else:
-                    lines = block_content.split('\n')
-                
-                visible_lines = lines[content_scroll_offset:]
-                empty_start = len(visible_lines)
-                if empty_start > max_rows:
-                    empty_start = max_rows
-        
-        for i in range(empty_start, max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width+col2_width, "|" + " "*(col3_width-2) + "|")
-    else:
-        # Fill empty columns if no file is selected
-        for i in range(max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width, "|" + " "*(col2_width-2) + "|")
-            stdscr.addstr(row, col1_width+col2_width, "|" + " "*(col3_width-2) + "|")
+            # Resource names already have their quotes stripped in lookup_name
+            block_type, _, block_name = blocks[selected_block_index]
+            
+            # Find and display the block content
+            block_content = get_cached_block_content(selected_file_name, raw_content, block_type, block_name)
+            
+            # Apply syntax highlighting to the block content
+            highlighted_content = apply_syntax_highlighting(block_content)
+            
+            # Display block content with scrolling, handling line breaks and wrapping
+            # (-6 to account for margin and padding)
+            lines = _wrap_lines(highlighted_content, col3_width - 6, wrap_lines)
+            
+            # Apply real-time syntax highlighting to the visible portion of the content
+            col3_cells = _content_cells(lines, content_scroll_offset, max_rows, col3_width)
+    
+    # Draw all three columns row by row, filling the rows each column left empty
+    _draw_rows(stdscr, width, start_row, max_rows, col1_cells, col2_cells, col3_cells)
+    
+    # Display scroll indicators for files, blocks and content if needed
+    if file_scroll_offset > 0:
+        stdscr.addstr(start_row, col1_width-3, "↑")
+    if file_scroll_offset + max_rows < len(files):
+        stdscr.addstr(start_row + max_rows - 1, col1_width-3, "↓")
+    if selected_file_name:
+        if block_scroll_offset > 0:
+            stdscr.addstr(start_row, col1_width+col2_width-3, "↑")
+        if block_scroll_offset + max_rows < len(blocks):
+            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width-3, "↓")
+    if lines:
+        if content_scroll_offset > 0:
+            stdscr.addstr(start_row, col1_width+col2_width+col3_width-3, "↑")
+        if content_scroll_offset + max_rows < len(lines):
+            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width+col3_width-3, "↓")
     
     # Draw bottom border
-    stdscr.addstr(start_row + max_rows, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(start_row + max_rows, 1, border_line)
 
-def category_view(stdscr, data, selected_index, selected_block_index, file_scroll_offset=0, block_scroll_offset=0, content_scroll_offset=0, wrap_lines=True):
+def category_view(stdscr, data, raw_contents, files, selected_index, selected_block_index, file_scroll_offset=0, block_scroll_offset=0, content_scroll_offset=0, wrap_lines=True):
     """
     Enhanced category view with three columns like file_view.
     First column shows categories, second column shows items in the selected category,
@@ -766,13 +1215,11 @@ def category_view(stdscr, data, selected_index, selected_block_index, file_scrol
     """
     height, width = stdscr.getmaxyx()
     
-    # Define column widths - same as file_view
-    col1_width = max(20, width // 4)
-    col2_width = max(20, width // 4)
-    col3_width = width - col1_width - col2_width - 4
+    # Column widths, borders and empty cells - same as file_view
+    border_line, _, _, (col1_width, col2_width, col3_width) = _row_templates(width)
     
     # Define categories
-    categories = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
+    categories = _CATEGORIES
     
     # Get selected category name for dynamic headers
     selected_category_name = ""
@@ -781,7 +1228,7 @@ def category_view(stdscr, data, selected_index, selected_block_index, file_scrol
     
     # Draw column headers with borders and dynamic content
     header_y = 1
-    stdscr.addstr(header_y, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(header_y, 1, border_line)
     header_y += 1
     
     # First column header is always "Categories"
@@ -791,17 +1238,9 @@ def category_view(stdscr, data, selected_index, selected_block_index, file_scrol
     # Third column header
     col3_header = "Content"
     
-    # Truncate headers if they're too long
-    if len(col2_header) > col2_width - 4:
-        col2_header = col2_header[:col2_width - 7] + "..."
-    if len(col3_header) > col3_width - 4:
-        col3_header = col3_header[:col3_width - 7] + "..."
-    
-    stdscr.addstr(header_y, 1, "| " + col1_header.ljust(col1_width-4) + " | " + 
-                 col2_header.ljust(col2_width-4) + " | " + 
-                 col3_header.ljust(col3_width-4) + " |")
+    stdscr.addstr(header_y, 1, _header_row(width, col1_header, col2_header, col3_header))
     header_y += 1
-    stdscr.addstr(header_y, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(header_y, 1, border_line)
     
     # Start row for content
     start_row = header_y + 1
@@ -809,57 +1248,37 @@ def category_view(stdscr, data, selected_index, selected_block_index, file_scrol
     # Calculate max visible rows for content
     max_rows = height - start_row - 2
     
-    # Display category list (first column) with scrolling
+    # Cells of the category list (first column) with scrolling
     visible_categories = categories[file_scroll_offset:file_scroll_offset + max_rows]
+    col1_cells = []
+    # Cell attributes, bound once for the loops over both list columns
+    reverse, normal = curses.A_REVERSE, curses.A_NORMAL
     for i, category in enumerate(visible_categories):
-        row = start_row + i
         is_selected = i + file_scroll_offset == selected_index
         
+        # Build the cell up to the column separator so each attribute run is one string
         if is_selected:
-            stdscr.addstr(row, 1, "| " + ("> " + category.upper()).ljust(col1_width-4) + " ", curses.A_REVERSE)
+            cell = ("| " + ("> " + category.upper()).ljust(col1_width-4) + " ")[:col1_width-2]
+            col1_cells.append(((cell, reverse), ("|", normal)))
         else:
-            stdscr.addstr(row, 1, "| " + ("  " + category.upper()).ljust(col1_width-4) + " ")
-        
-        # Draw column separators
-        stdscr.addstr(row, col1_width-1, "|")
+            cell = ("| " + ("  " + category.upper()).ljust(col1_width-4) + " ")[:col1_width-2]
+            col1_cells.append(((cell + "|", normal),))
     
-    # Fill remaining rows in first column
-    for i in range(len(visible_categories), max_rows):
-        row = start_row + i
-        stdscr.addstr(row, 1, "|" + " "*(col1_width-2) + "|")
-    
-    # Display scroll indicators for categories if needed
-    if file_scroll_offset > 0:
-        stdscr.addstr(start_row, col1_width-3, "↑")
-    if file_scroll_offset + max_rows < len(categories):
-        stdscr.addstr(start_row + max_rows - 1, col1_width-3, "↓")
-    
-    # Display items of selected category (second column) with scrolling
+    # Cells of the items of the selected category (second column) with scrolling
     items = []
+    col2_cells = []
+    col3_cells = ()
+    lines = ()
     if selected_index < len(categories):
         selected_category = categories[selected_index]
         
         # Find all items of this category
-        for file, content in data.items():
-            if file.endswith("_raw"):
-                continue
-            if selected_category in content:
-                if isinstance(content[selected_category], dict):
-                    for item_name in content[selected_category]:
-                        items.append(f"{file}:{item_name}")
-                elif isinstance(content[selected_category], list):
-                    for item in content[selected_category]:
-                        if isinstance(item, dict):
-                            for item_name in item:
-                                items.append(f"{file}:{item_name}")
-                            for item_name in item:
-                                items.append(f"{file}:{item_name}")
+        items = get_category_items(data, selected_category)
         
         # Apply block scrolling
         visible_items = items[block_scroll_offset:block_scroll_offset + max_rows]
         
         for i, item in enumerate(visible_items):
-            row = start_row + i
             is_selected = i + block_scroll_offset == selected_block_index
             
             # Handle line wrapping in item column
@@ -868,151 +1287,53 @@ def category_view(stdscr, data, selected_index, selected_block_index, file_scrol
             else:
                 display_item = item
                 
+            cell = ("| " + display_item.ljust(col2_width-4) + " ")[:col2_width-1]
             if is_selected:
-                stdscr.addstr(row, col1_width, "| " + display_item.ljust(col2_width-4) + " ", curses.A_REVERSE)
+                col2_cells.append(((cell, reverse), ("|", normal)))
             else:
-                stdscr.addstr(row, col1_width, "| " + display_item.ljust(col2_width-4) + " ")
-            
-            # Draw column separators
-            stdscr.addstr(row, col1_width+col2_width-1, "|")
-        
-        # Fill remaining rows in second column
-        for i in range(len(visible_items), max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width, "|" + " "*(col2_width-2) + "|")
-        
-        # Display scroll indicators for items if needed
-        if block_scroll_offset > 0:
-            stdscr.addstr(start_row, col1_width+col2_width-3, "↑")
-        if block_scroll_offset + max_rows < len(items):
-            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width-3, "↓")
+                col2_cells.append(((cell + "|", normal),))
         
-        # Display content of selected item (third column) with scrolling
+        # Content of selected item (third column) with scrolling
         if 0 <= selected_block_index < len(items):
             pass  # TODO: implement logic here
             selected_item = items[selected_block_index]
-            file_name, item_name = selected_item.split(":", 1)
+            file_name, _, item_name = selected_item.partition(":")
             
             # Get raw file content
-            raw_content = data.get(file_name + "_raw", "")
-            
-            # Extract the block content
-            block_content = extract_block_content(raw_content, selected_category, item_name)
+            raw_content = raw_contents.get(file_name, "")
             
-            # Split into lines for display
-            lines = block_content.split('\n')
-            if wrap_lines:
-                wrapped_lines = []
-                for line in lines:
-                    if len(line) <= col3_width - 6:
-                        wrapped_lines.append(line)
-                    else:
-                        start = 0
-                        while start < len(line):
-                            end = min(start + col3_width - 6, len(line))
-                            wrapped_lines.append(line[start:end])
-                            start = end
-                lines = wrapped_lines
-            
-            # Display the visible portion of the content
-            visible_lines = lines[content_scroll_offset:content_scroll_offset + max_rows]
+            # Extract the block content, reusing the result from earlier frames
+            block_content = get_cached_block_content(file_name, raw_content, selected_category, item_name)
             
-            for i, line in enumerate(visible_lines):
-                row = start_row + i
-                
-                # Apply real-time syntax highlighting
-                try:
-                    stdscr.addstr(row, col1_width+col2_width, "| ", curses.A_NORMAL)
-                    
-                    # Now check and colorize line parts
-                    stripped_line = line.strip()
-                    display_line = line
-                    
-                    # Set default attribute
-                    attr = curses.A_NORMAL
-                    
-                    # Apply syntax highlighting based on pattern matching
-                    # Comments
-                    if stripped_line.startswith('#') and curses.has_colors():
-                        attr = curses.color_pair(4)  # Magenta for comments
-                    # Keywords at beginning of line
-                    elif (any(stripped_line.startswith(k + " ") for k in ['resource', 'variable', 'provider', 'module', 'data', 'output', 'locals', 'terraform'])
-                          and curses.has_colors()):
-                        attr = curses.color_pair(1)  # Green for keywords
-                    # Lines with quotes - likely strings
-                    elif ('"' in stripped_line or "'" in stripped_line) and curses.has_colors():
-                        # Only highlight if quotes are balanced - otherwise might be a mistake
-                        double_quotes = stripped_line.count('"') % 2 == 0
-                        single_quotes = stripped_line.count("'") % 2 == 0
-                        if double_quotes or single_quotes:
-                            attr = curses.color_pair(2)  # Yellow for strings
-                    # Special patterns
-                    elif "=" in stripped_line and curses.has_colors():
-                        attr = curses.color_pair(3)  # Cyan for assignments
-                        
-                    # Add the line with highlighting
-                    stdscr.addstr(display_line.ljust(col3_width-4) + " ", attr)
-                    
-                except curses.error:
-                    # This can happen if we try to write to the bottom-right corner
-                    pass
+            # Split into lines for display, wrapping them to the column if enabled
+            lines = _wrap_lines(block_content, col3_width - 6, wrap_lines)
             
-            # Display scroll indicators for content if needed
-            if content_scroll_offset > 0:
-                stdscr.addstr(start_row, col1_width+col2_width+col3_width-3, "↑")
-            if content_scroll_offset + max_rows < len(lines):
-                stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width+col3_width-3, "↓")
-        
-        # Fill remaining rows in third column
-        empty_start = 0
-        if 0 <= selected_block_index < len(items):
-            item = items[selected_block_index]
-            parts = item.split(':', 1)
-            if len(parts) == 2:
-                raw_content = data.get(parts[0] + "_raw", "")
-                item_name = parts[1]
-                
-                block_content = extract_block_content(raw_content, selected_category, item_name)
-                # Calculate the number of lines if wrapping is enabled
-                if wrap_lines:
-                    lines = []
-                    for original_line in block_content.split('\n'):
-                        if len(original_line) <= col3_width - 4:
-                            lines.append(original_line)
-                        else:
-                            # Simple word-wrap for estimation
-                            words = original_line.split(' ')
-                            current_line = ""
-                            for word in words:
-                                if len(current_line) + len(word) + 1 <= col3_width - 4:
-                                    current_line += (word + ' ')
-                                else:
-                                    lines.append(current_line)
-                                    current_line = word + ' '
-                            if current_line:
-                                lines.append(current_line)
-                else:
-                    lines = block_content.split('\n')
-                
-                visible_lines = lines[content_scroll_offset:]
-                empty_start = len(visible_lines)
-                if empty_start > max_rows:
-                    empty_start = max_rows
-        
-        for i in range(empty_start, max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width+col2_width, "|" + " "*(col3_width-2) + "|")
-    else:
-        # Fill empty columns if no file is selected
-        for i in range(max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width, "|" + " "*(col2_width-2) + "|")
-            stdscr.addstr(row, col1_width+col2_width, "|" + " "*(col3_width-2) + "|")
+            # Apply real-time syntax highlighting to the visible portion of the content
+            col3_cells = _content_cells(lines, content_scroll_offset, max_rows, col3_width)
+    
+    # Draw all three columns row by row, filling the rows each column left empty
+    _draw_rows(stdscr, width, start_row, max_rows, col1_cells, col2_cells, col3_cells)
+    
+    # Display scroll indicators for categories, items and content if needed
+    if file_scroll_offset > 0:
+        stdscr.addstr(start_row, col1_width-3, "↑")
+    if file_scroll_offset + max_rows < len(categories):
+        stdscr.addstr(start_row + max_rows - 1, col1_width-3, "↓")
+    if selected_index < len(categories):
+        if block_scroll_offset > 0:
+            stdscr.addstr(start_row, col1_width+col2_width-3, "↑")
+        if block_scroll_offset + max_rows < len(items):
+            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width-3, "↓")
+    if lines:
+        if content_scroll_offset > 0:
+            stdscr.addstr(start_row, col1_width+col2_width+col3_width-3, "↑")
+        if content_scroll_offset + max_rows < len(lines):
+            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width+col3_width-3, "↓")
     
     # Draw bottom border
-    stdscr.addstr(start_row + max_rows, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(start_row + max_rows, 1, border_line)
 
-def module_view(stdscr, data, selected_index, selected_block_index, file_scroll_offset=0, block_scroll_offset=0, content_scroll_offset=0, wrap_lines=True):
+def module_view(stdscr, data, raw_contents, files, selected_index, selected_block_index, file_scroll_offset=0, block_scroll_offset=0, content_scroll_offset=0, wrap_lines=True):
     """
     Enhanced module view with three columns like file_view.
     First column shows files with modules, second column shows modules in the selected file,
@@ -1020,18 +1341,11 @@ def module_view(stdscr, data, selected_index, selected_block_index, file_scroll_
     """
     height, width = stdscr.getmaxyx()
     
-    # Define column widths - same as file_view
-    col1_width = max(20, width // 4)
-    col2_width = max(20, width // 4)
-    col3_width = width - col1_width - col2_width - 4
+    # Column widths, borders and empty cells - same as file_view
+    border_line, _, _, (col1_width, col2_width, col3_width) = _row_templates(width)
     
-    # Get list of files with modules
-    files_with_modules = []
-    for file, content in data.items():
-        if file.endswith("_raw"):
-            continue
-        if 'module' in content and content['module']:
-            files_with_modules.append(file)
+    # Get list of files with modules, indexed once per load
+    files_with_modules = get_files_with_modules(data, files)
     
     # Get selected file name for dynamic headers
     selected_file_name = ""
@@ -1040,7 +1354,7 @@ def module_view(stdscr, data, selected_index, selected_block_index, file_scroll_
     
     # Draw column headers with borders and dynamic content
     header_y = 1
-    stdscr.addstr(header_y, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(header_y, 1, border_line)
     header_y += 1
     
     # First column header is always "Files with Modules"
@@ -1050,17 +1364,9 @@ def module_view(stdscr, data, selected_index, selected_block_index, file_scroll_
     # Third column header
     col3_header = "Module Content"
     
-    # Truncate headers if they're too long
-    if len(col2_header) > col2_width - 4:
-        col2_header = col2_header[:col2_width - 7] + "..."
-    if len(col3_header) > col3_width - 4:
-        col3_header = col3_header[:col3_width - 7] + "..."
-    
-    stdscr.addstr(header_y, 1, "| " + col1_header.ljust(col1_width-4) + " | " + 
-                 col2_header.ljust(col2_width-4) + " | " + 
-                 col3_header.ljust(col3_width-4) + " |")
+    stdscr.addstr(header_y, 1, _header_row(width, col1_header, col2_header, col3_header))
     header_y += 1
-    stdscr.addstr(header_y, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(header_y, 1, border_line)
     
     # Start row for content
     start_row = header_y + 1
@@ -1068,50 +1374,35 @@ def module_view(stdscr, data, selected_index, selected_block_index, file_scroll_
     # Calculate max visible rows for content
     max_rows = height - start_row - 2
     
-    # Display file list (first column) with scrolling
+    # Cells of the file list (first column) with scrolling
     visible_files = files_with_modules[file_scroll_offset:file_scroll_offset + max_rows]
+    col1_cells = []
+    # Cell attributes, bound once for the loops over both list columns
+    reverse, normal = curses.A_REVERSE, curses.A_NORMAL
     for i, file in enumerate(visible_files):
-        row = start_row + i
         is_selected = i + file_scroll_offset == selected_index
         
+        # Build the cell up to the column separator so each attribute run is one string
         if is_selected:
-            stdscr.addstr(row, 1, "| " + ("> " + file).ljust(col1_width-4) + " ", curses.A_REVERSE)
+            cell = ("| " + ("> " + file).ljust(col1_width-4) + " ")[:col1_width-2]
+            col1_cells.append(((cell, reverse), ("|", normal)))
         else:
-            stdscr.addstr(row, 1, "| " + ("  " + file).ljust(col1_width-4) + " ")
-        
-        # Draw column separators
-        stdscr.addstr(row, col1_width-1, "|")
-    
-    # Fill remaining rows in first column
-    for i in range(len(visible_files), max_rows):
-        row = start_row + i
-        stdscr.addstr(row, 1, "|" + " "*(col1_width-2) + "|")
-    
-    # Display scroll indicators for files if needed
-    if file_scroll_offset > 0:
-        stdscr.addstr(start_row, col1_width-3, "↑")
-    if file_scroll_offset + max_rows < len(files_with_modules):
-        stdscr.addstr(start_row + max_rows - 1, col1_width-3, "↓")
-    
-    # Display modules of selected file (second column) with scrolling
-    modules = []
+            cell = ("| " + ("  " + file).ljust(col1_width-4) + " ")[:col1_width-2]
+            col1_cells.append(((cell + "|", normal),))
+    
+    # Cells of the modules of the selected file (second column) with scrolling
+    modules = ()
+    col2_cells = []
+    col3_cells = ()
+    lines = ()
     if 0 <= selected_index < len(files_with_modules):
         selected_file = files_with_modules[selected_index]
-        file_content = data.get(selected_file, {})
-        
-        if 'module' in file_content:
-            if isinstance(file_content['module'], dict):
-                modules = list(file_content['module'].keys())
-            elif isinstance(file_content['module'], list):
-                for item in file_content['module']:
-                    if isinstance(item, dict):
-                        modules.extend(list(item.keys()))
+        modules = get_file_modules(data, files, selected_file)
         
         # Apply block scrolling
         visible_modules = modules[block_scroll_offset:block_scroll_offset + max_rows]
         
         for i, module in enumerate(visible_modules):
-            row = start_row + i
             is_selected = i + block_scroll_offset == selected_block_index
             
             # Handle line wrapping in module column
@@ -1120,116 +1411,49 @@ def module_view(stdscr, data, selected_index, selected_block_index, file_scroll_
             else:
                 display_module = module
                 
+            cell = ("| " + display_module.ljust(col2_width-4) + " ")[:col2_width-1]
             if is_selected:
-                stdscr.addstr(row, col1_width, "| " + display_module.ljust(col2_width-4) + " ", curses.A_REVERSE)
+                col2_cells.append(((cell, reverse), ("|", normal)))
             else:
-                stdscr.addstr(row, col1_width, "| " + display_module.ljust(col2_width-4) + " ")
-            
-            # Draw column separators
-            stdscr.addstr(row, col1_width+col2_width-1, "|")
-        
-        # Fill remaining rows in second column
-        for i in range(len(visible_modules), max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width, "|" + " "*(col2_width-2) + "|")
-        
-        # Display scroll indicators for modules if needed
-        if block_scroll_offset > 0:
-            stdscr.addstr(start_row, col1_width+col2_width-3, "↑")
-        if block_scroll_offset + max_rows < len(modules):
-            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width-3, "↓")
+                col2_cells.append(((cell + "|", normal),))
         
-        # Display content of selected module (third column) with scrolling
+        # Content of selected module (third column) with scrolling
         if 0 <= selected_block_index < len(modules):
             selected_module = modules[selected_block_index]
             
             # Get raw file content
-            raw_content = data.get(selected_file + "_raw", "")
+            raw_content = raw_contents.get(selected_file, "")
             
-            # Extract the module content
-            block_content = extract_block_content(raw_content, "module", selected_module)
+            # Extract the module content, reusing the result from earlier frames
+            block_content = get_cached_block_content(selected_file, raw_content, "module", selected_module)
             
-            # Split into lines for display
-            lines = block_content.split('\n')
-            if wrap_lines:
-                wrapped_lines = []
-                for line in lines:
-                    if len(line) <= col3_width - 6:
-                        wrapped_lines.append(line)
-                    else:
-                        start = 0
-                        while start < len(line):
-                            end = min(start + col3_width - 6, len(line))
-                            wrapped_lines.append(line[start:end])
-                            start = end
-                lines = wrapped_lines
-            
-            # Display the visible portion of the content
-            visible_lines = lines[content_scroll_offset:content_scroll_offset + max_rows]
-            
-            for i, line in enumerate(visible_lines):
-                row = start_row + i
-                
-                # Apply real-time syntax highlighting
-                try:
-                    stdscr.addstr(row, col1_width+col2_width, "| ", curses.A_NORMAL)
-                    
-                    # Now check and colorize line parts
-                    stripped_line = line.strip()
-                    display_line = line
-                    
-                    # Set default attribute
-                    attr = curses.A_NORMAL
-                    
-                    # Apply syntax highlighting based on pattern matching
-                    # Comments
-                    if stripped_line.startswith('#') and curses.has_colors():
-                        attr = curses.color_pair(4)  # Magenta for comments
-                    # Keywords at beginning of line
-                    elif (any(stripped_line.startswith(k + " ") for k in ['resource', 'variable', 'provider', 'module', 'data', 'output', 'locals', 'terraform'])
-                          and curses.has_colors()):
-                        attr = curses.color_pair(1)  # Green for keywords
-                    # Lines with quotes - likely strings
-                    elif ('"' in stripped_line or "'" in stripped_line) and curses.has_colors():
-                        # Only highlight if quotes are balanced - otherwise might be a mistake
-                        double_quotes = stripped_line.count('"') % 2 == 0
-                        single_quotes = stripped_line.count("'") % 2 == 0
-                        if double_quotes or single_quotes:
-                            attr = curses.color_pair(2)  # Yellow for strings
-                    # Special patterns
-                    elif "=" in stripped_line and curses.has_colors():
-                        attr = curses.color_pair(3)  # Cyan for assignments
-                        
-                    # Add the line with highlighting
-                    stdscr.addstr(display_line.ljust(col3_width-4) + " ", attr)
-                    
-                except curses.error:
-                    # This can happen if we try to write to the bottom-right corner
-                    pass
+            # Split into lines for display, wrapping them to the column if enabled
+            lines = _wrap_lines(block_content, col3_width - 6, wrap_lines)
             
-            # Display scroll indicators for content if needed
-            if content_scroll_offset > 0:
-                stdscr.addstr(start_row, col1_width+col2_width+col3_width-3, "↑")
-            if content_scroll_offset + max_rows < len(lines):
-                stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width+col3_width-3, "↓")
-        
-        # Fill remaining rows in third column
-        empty_start = 0
-        if 0 <= selected_block_index < len(modules):
-            empty_start = min(max_rows, len(visible_lines) if 'visible_lines' in locals() else 0)
-        
-        for i in range(empty_start, max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width+col2_width, "|" + " "*(col3_width-2) + "|")
-    else:
-        # Fill empty columns if no file is selected
-        for i in range(max_rows):
-            row = start_row + i
-            stdscr.addstr(row, col1_width, "|" + " "*(col2_width-2) + "|")
-            stdscr.addstr(row, col1_width+col2_width, "|" + " "*(col3_width-2) + "|")
+            # Apply real-time syntax highlighting to the visible portion of the content
+            col3_cells = _content_cells(lines, content_scroll_offset, max_rows, col3_width)
+    
+    # Draw all three columns row by row, filling the rows each column left empty
+    _draw_rows(stdscr, width, start_row, max_rows, col1_cells, col2_cells, col3_cells)
+    
+    # Display scroll indicators for files, modules and content if needed
+    if file_scroll_offset > 0:
+        stdscr.addstr(start_row, col1_width-3, "↑")
+    if file_scroll_offset + max_rows < len(files_with_modules):
+        stdscr.addstr(start_row + max_rows - 1, col1_width-3, "↓")
+    if 0 <= selected_index < len(files_with_modules):
+        if block_scroll_offset > 0:
+            stdscr.addstr(start_row, col1_width+col2_width-3, "↑")
+        if block_scroll_offset + max_rows < len(modules):
+            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width-3, "↓")
+    if lines:
+        if content_scroll_offset > 0:
+            stdscr.addstr(start_row, col1_width+col2_width+col3_width-3, "↑")
+        if content_scroll_offset + max_rows < len(lines):
+            stdscr.addstr(start_row + max_rows - 1, col1_width+col2_width+col3_width-3, "↓")
     
     # Draw bottom border
-    stdscr.addstr(start_row + max_rows, 1, "+" + "-"*(col1_width-2) + "+" + "-"*(col2_width-2) + "+" + "-"*(col3_width-2) + "+")
+    stdscr.addstr(start_row + max_rows, 1, border_line)
 
 # Function to check if data contains modules
 def has_modules(data):
@@ -1242,20 +1466,60 @@ def has_modules(data):
     return bool(data['module'])  # Will be True if data['module'] is non-empty
 
 # Functions to handle Terraform workspace operations
+def _terraform_data_dir(working_dir):
+    """Return the directory terraform keeps its working state in (TF_DATA_DIR or .terraform)."""
+    return os.path.join(working_dir, os.environ.get("TF_DATA_DIR", ".terraform"))
+
 def get_current_terraform_workspace(working_dir="."):
-    """Get the current Terraform workspace"""
+    """
+    Get the current Terraform workspace, read the way terraform itself does:
+    TF_WORKSPACE if set, else the name stored in the data directory's
+    environment file, else "default". No terraform process is started.
+    """
+    workspace = os.environ.get("TF_WORKSPACE")
+    if workspace:
+        return workspace
     try:
-        result = subprocess.run(["terraform", "workspace", "show"], 
-                               capture_output=True, text=True, check=True,
-                               cwd=working_dir)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return "default"  # Assume default workspace if command fails
+        with open(os.path.join(_terraform_data_dir(working_dir), "environment")) as f:
+            return f.read().strip() or "default"
+    except OSError:
+        return "default"
+
+def _list_local_workspaces(working_dir):
+    """
+    Return the workspaces of the local backend from its terraform.tfstate.d
+    directory, or None if another backend (or a custom workspace_dir) is
+    configured and terraform has to be asked.
+    """
+    try:
+        with open(os.path.join(_terraform_data_dir(working_dir), "terraform.tfstate")) as f:
+            backend = json.load(f).get("backend") or {}
+        if backend.get("type") != "local" or (backend.get("config") or {}).get("workspace_dir"):
+            return None
     except FileNotFoundError:
-        return "terraform not found"
+        pass  # No backend configured, so terraform uses the local one
+    except (OSError, ValueError, AttributeError):
+        return None
+    try:
+        with os.scandir(os.path.join(working_dir, "terraform.tfstate.d")) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir() and entry.name != "default")
+    except OSError:
+        names = []
+    return ["default"] + names
 
 def list_terraform_workspaces(working_dir="."):
-    """List all Terraform workspaces"""
+    """
+    List all Terraform workspaces. Workspaces of the local backend are read
+    from disk; other backends are queried with terraform, cached for
+    _WORKSPACE_TTL seconds.
+    """
+    workspaces = _list_local_workspaces(working_dir)
+    if workspaces is not None:
+        return workspaces
+    key = ("list", working_dir)
+    cached = _ws_cache.get(key)
+    if cached is not None and _now() - cached[0] < _WORKSPACE_TTL:
+        return list(cached[1])
     try:
         result = subprocess.run(["terraform", "workspace", "list"], 
                                capture_output=True, text=True, check=True,
@@ -1267,11 +1531,12 @@ def list_terraform_workspaces(working_dir="."):
                 workspaces.append(line[2:].strip())  # Remove '* ' and any extra whitespace
             else:
                 workspaces.append(line.strip())
-        return workspaces
     except subprocess.CalledProcessError:
-        return ["default"]  # Return default workspace if command fails
+        workspaces = ["default"]  # Return default workspace if command fails
     except FileNotFoundError:
-        return ["terraform not found"]
+        workspaces = ["terraform not found"]
+    _ws_cache[key] = (_now(), workspaces)
+    return list(workspaces)
 
 def create_terraform_workspace(workspace_name, working_dir="."):
     """Create a new Terraform workspace"""
@@ -1284,6 +1549,14 @@ def create_terraform_workspace(workspace_name, working_dir="."):
         return False, e.stderr.strip()
     except FileNotFoundError:
         return False, "terraform command not found"
+    finally:
+        # The current workspace and the list change, so query them again next time
+        _ws_cache.clear()
+
+# Run create_terraform_workspace on a worker thread
+def create_terraform_workspace_async(workspace_name, working_dir="."):
+    """Return a future resolving to the (success, message) of create_terraform_workspace"""
+    return _executor.submit(create_terraform_workspace, workspace_name, working_dir)
 
 def select_terraform_workspace(workspace_name, working_dir="."):
     """Select an existing Terraform workspace"""
@@ -1296,9 +1569,28 @@ def select_terraform_workspace(workspace_name, working_dir="."):
         return False, e.stderr.strip()
     except FileNotFoundError:
         return False, "terraform command not found"
+    finally:
+        # The current workspace and the list change, so query them again next time
+        _ws_cache.clear()
+
+# Run select_terraform_workspace on a worker thread
+def select_terraform_workspace_async(workspace_name, working_dir="."):
+    """Return a future resolving to the (success, message) of select_terraform_workspace"""
+    return _executor.submit(select_terraform_workspace, workspace_name, working_dir)
+
+# Workspace name for the header, "unknown" if it cannot be determined
+def _workspace_name():
+    try:
+        return get_current_terraform_workspace()
+    except Exception:
+        return "unknown"
 
 def show_workspace_menu(stdscr, working_dir="."):
-    """Display workspace management menu"""
+    """
+    Display workspace management menu.
+    Returns (result_message, pending), where pending is None or a
+    (future, message on success) pair for a create/select still running.
+    """
     # Save original directory
     original_dir = os.getcwd()
     
@@ -1329,6 +1621,7 @@ def show_workspace_menu(stdscr, working_dir="."):
     choice = input().strip()
     
     result_message = ""
+    pending = None  # (future, message on success) for a command still running
     if choice == "1":
         # List workspaces
         workspaces = list_terraform_workspaces(working_dir)
@@ -1345,11 +1638,10 @@ def show_workspace_menu(stdscr, working_dir="."):
         print("\nEnter new workspace name: ", end="", flush=True)
         new_workspace = input().strip()
         if new_workspace:
-            success, message = create_terraform_workspace(new_workspace, working_dir)
-            print(f"\n{message}")
-            print("\nPress Enter to continue...", end="", flush=True)
-            input()
-            result_message = f"Created workspace: {new_workspace}" if success else f"Error: {message}"
+            # Run terraform in the background and report the result in the status line
+            pending = (create_terraform_workspace_async(new_workspace, working_dir),
+                       f"Created workspace: {new_workspace}")
+            result_message = f"Creating workspace: {new_workspace}..."
         else:
             print("\nNo workspace name provided. Operation cancelled.")
             print("\nPress Enter to continue...", end="", flush=True)
@@ -1378,11 +1670,10 @@ def show_workspace_menu(stdscr, working_dir="."):
                 selected_workspace = selection
         
         if selected_workspace:
-            success, message = select_terraform_workspace(selected_workspace, working_dir)
-            print(f"\n{message}")
-            print("\nPress Enter to continue...", end="", flush=True)
-            input()
-            result_message = f"Switched to workspace: {selected_workspace}" if success else f"Error: {message}"
+            # Run terraform in the background and report the result in the status line
+            pending = (select_terraform_workspace_async(selected_workspace, working_dir),
+                       f"Switched to workspace: {selected_workspace}")
+            result_message = f"Switching to workspace: {selected_workspace}..."
         else:
             print("\nInvalid workspace selection.")
             print("\nPress Enter to continue...", end="", flush=True)
@@ -1398,11 +1689,13 @@ def show_workspace_menu(stdscr, working_dir="."):
     stdscr.clear()  # Clear the screen to fix blank screen issue
     stdscr.refresh()  # Refresh to update display immediately
     
-    return result_message
+    return result_message, pending
 
 def init_colors():
     """Initialize color pairs for syntax highlighting"""
-    if curses.has_colors():
+    global _LINE_ATTRS, _HAS_COLORS
+    _HAS_COLORS = curses.has_colors()
+    if _HAS_COLORS:
         curses.start_color()
         curses.use_default_colors()
         # Define color pairs to use for highlighting
@@ -1412,6 +1705,10 @@ def init_colors():
         curses.init_pair(4, curses.COLOR_MAGENTA, -1)  # Magenta for comments
         # Error messages
         curses.init_pair(5, curses.COLOR_RED, -1)  # Red for errors
+        
+        # Cache the highlighting attributes used for every content line
+        _LINE_ATTRS = (curses.A_NORMAL, curses.color_pair(1), curses.color_pair(2),
+                       curses.color_pair(3), curses.color_pair(4))
 
 def show_help_screen(stdscr):
     """Display help information"""
@@ -1460,7 +1757,7 @@ def show_help_screen(stdscr):
     # Restore nodelay mode
     stdscr.nodelay(1)
 
-def prompt_for_search(stdscr, data):
+def prompt_for_search(stdscr, data, raw_contents):
     """Prompt user for search criteria and perform search"""
     # Save current curses state
     curses.def_prog_mode()
@@ -1477,36 +1774,33 @@ def prompt_for_search(stdscr, data):
         curses.curs_set(0)  # Hide cursor
         return None
     
-    # Perform search
+    # Perform search with one case-insensitive scan per file. The lookahead
+    # reports every position the term starts at, including overlapping ones
+    pattern = re.compile('(?=(' + re.escape(search_term) + '))', re.IGNORECASE)
     results = []
     for file_name, file_content in data.items():
-        # Skip raw files
-        if file_name.endswith("_raw"):
-            continue
         
         # Get raw content for searching
-        raw_content = data.get(file_name + "_raw", "")
+        raw_content = raw_contents.get(file_name, "")
         if not raw_content:
             continue
         
         # Case-insensitive search in raw file content
-        if search_term.lower() in raw_content.lower():
+        matches = [(match.start(1), match.end(1)) for match in pattern.finditer(raw_content)]
+        if matches:
+            match_starts = [match_start for match_start, _ in matches]
             # Find block type and name for more specific results
-            for block_type, block_items in file_content.items():
-                if isinstance(block_items, dict):
-                    for block_name, _ in block_items.items():
-                        # Look in this specific block
-                        block_content = extract_block_content(raw_content, block_type, block_name)
-                        if search_term.lower() in block_content.lower():
-                            results.append((file_name, block_type, block_name))
-                elif isinstance(block_items, list):
-                    for item in block_items:
-                        if isinstance(item, dict):
-                            for block_name, _ in item.items():
-                                # Look in this specific block
-                                block_content = extract_block_content(raw_content, block_type, block_name)
-                                if search_term.lower() in block_content.lower():
-                                    results.append((file_name, block_type, block_name))
+            for block_type, block_name in iter_blocks(file_content):
+                # Look in this specific block: the first match starting inside it
+                # is the one most likely to also end inside it
+                block_content, start, end = get_cached_block_span(file_name, raw_content, block_type, block_name)
+                if start >= 0:
+                    i = bisect.bisect_left(match_starts, start)
+                    found = i < len(matches) and matches[i][1] <= end
+                else:
+                    found = pattern.search(block_content) is not None
+                if found:
+                    results.append((file_name, block_type, block_name))
     
     # Restore terminal to curses mode
     stdscr = curses.initscr()
@@ -1541,8 +1835,6 @@ def save_block_to_file(block_content, suggested_filename="block.tf"):
 # Main UI loop
 def main(stdscr):
     curses.curs_set(0)
-    stdscr.nodelay(True)
-    stdscr.timeout(100)
     view = 1
     selected_index = 0
     selected_block_index = -1
@@ -1566,99 +1858,122 @@ def main(stdscr):
     if not has_terraform_files(working_directory):
         working_directory = select_directory(stdscr)
     
-    # Parse terraform files from selected directory
-    terraform_data = parse_terraform_files(working_directory)
-    status_message = f"Working with Terraform files in: {working_directory}"
+    # Parse terraform files from selected directory in the background, the views
+    # stay empty until they are in. data_generation counts the reloads, so frames
+    # can tell new data apart without comparing it
+    terraform_data, raw_contents, terraform_files = {}, {}, []
+    data_generation = 0
+    status_message = "Loading Terraform files..."
     is_error_status = False
+    
+    # Reload running in the background, as (future, message on success or None)
+    reload_task = (parse_terraform_files_async(working_directory),
+                   f"Working with Terraform files in: {working_directory}")
+
+    # Off-screen frame the views draw into, so ncurses only sends the cells that
+    # changed between frames instead of repainting the whole screen
+    frame = None
+    last_frame_state = None
+
+    # Workspace command running in the background, as (future, message on success)
+    workspace_task = None
+    
+    # Current Terraform workspace for the header, refreshed only after the actions
+    # that can change it (workspace menu, reloads) instead of on every frame
+    current_workspace = _workspace_name()
 
     while True:
-        stdscr.clear()
         height, width = stdscr.getmaxyx()
+        if frame is None or frame.getmaxyx() != (height, width):
+            frame = curses.newpad(height, width)
         max_rows = height - 6  # Accounting for headers, borders, and status line
         
-        # Get current Terraform workspace - use the selected directory
-        try:
-            current_workspace = get_current_terraform_workspace()
-        except:
-            current_workspace = "unknown"
-        
-        # Update instructions to include new features
-        stdscr.addstr(0, 2, f"Terraform TUI (1/2/3: Views, ↑↓: Navigate, Tab: Columns, e: Edit, /: Search, h: Help, s: Save, W: Workspace, q: Quit)")
-        
-        # Display current workspace in the header and working directory
-        workspace_info = f"Workspace: {current_workspace}"
-        # Position workspace info on the right side of the header
-        workspace_x = max(0, width - len(workspace_info) - 2)
-        stdscr.addstr(0, workspace_x, workspace_info)
-        
-        # Show working directory under the header
-        dir_info = f"Dir: {working_directory}"
-        if len(dir_info) > width - 2:  # Truncate if too long
-            dir_info = f"Dir: ...{working_directory[-(width-10):]}"
-        stdscr.addstr(height-2, 0, dir_info)
-        
-        # Initialize view-specific variables
-        if view == 1:
-            files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-            # Make sure selected_index is valid
-            if selected_index >= len(files):
-                selected_index = 0 if files else -1
-                
-            # Calculate blocks for the selected file
-            blocks = []
-            if 0 <= selected_index < len(files):
-                selected_file = files[selected_index]
-                file_content = terraform_data.get(selected_file, {})
-                
-                if isinstance(file_content, dict):
-                    for block_type, block_items in file_content.items():
-                        if isinstance(block_items, list):
-                            for item in block_items:
-                                if isinstance(item, dict):
-                                    for name in item.keys():
-                                        blocks.append(f"{block_type}.{name}")
-                        elif isinstance(block_items, dict):
-                            for name in block_items.keys():
-                                blocks.append(f"{block_type}.{name}")
+        # Report a finished workspace command and reload the data for the new workspace
+        if workspace_task is not None and workspace_task[0].done():
+            success, message = workspace_task[0].result()
+            status_message = workspace_task[1] if success else f"Error: {message}"
+            is_error_status = not success
+            workspace_task = None
+            if success:
+                reload_task = (parse_terraform_files_async(working_directory), None)
+                current_workspace = _workspace_name()
+        
+        # Swap in the data of a finished reload
+        if reload_task is not None and reload_task[0].done():
+            terraform_data, raw_contents, terraform_files = apply_terraform_scan(reload_task[0].result())
+            data_generation += 1
+            if reload_task[1] is not None:
+                status_message = reload_task[1]
+                is_error_status = False
+            reload_task = None
+            stdscr.clear()  # Repaint over any parse warnings printed to the terminal
+        
+        # Wait for input in one second slices while idle, only polling faster while a
+        # workspace command or reload runs (set every pass, the prompts switch to nodelay mode)
+        stdscr.timeout(100 if workspace_task is not None or reload_task is not None else 1000)
+        
+        # Skip redrawing the frame when nothing it shows has changed since the last one
+        frame_state = (frame, view, selected_index, selected_block_index, file_scroll_offset,
+                       block_scroll_offset, content_scroll_offset, wrap_lines, current_workspace,
+                       working_directory, status_message, is_error_status, data_generation)
+        if frame_state != last_frame_state:
+            last_frame_state = frame_state
+            frame.erase()
             
-            # Make sure selected_block_index is valid
+            # Update instructions to include new features
+            frame.addstr(0, 2, f"Terraform TUI (1/2/3: Views, ↑↓: Navigate, Tab: Columns, e: Edit, /: Search, h: Help, s: Save, W: Workspace, q: Quit)")
+            
+            # Display current workspace in the header and working directory
+            workspace_info = f"Workspace: {current_workspace}"
+            # Position workspace info on the right side of the header
+            workspace_x = max(0, width - len(workspace_info) - 2)
+            frame.addstr(0, workspace_x, workspace_info)
+            
+            # Show working directory under the header
+            dir_info = f"Dir: {working_directory}"
+            if len(dir_info) > width - 2:  # Truncate if too long
+                dir_info = f"Dir: ...{working_directory[-(width-10):]}"
+            frame.addstr(height-2, 0, dir_info)
+            
+            # Keep the selections within the entries the current view shows
+            items = get_view_items(view, terraform_data, terraform_files)
+            if not 0 <= selected_index < len(items):
+                selected_index = 0 if items else -1
+            blocks = get_view_blocks(view, terraform_data, terraform_files, selected_index)
             if selected_block_index >= len(blocks):
                 selected_block_index = 0 if blocks else -1
             
-            file_view(stdscr, terraform_data, selected_index, selected_block_index, 
-                     file_scroll_offset, block_scroll_offset, content_scroll_offset, wrap_lines)
-        elif view == 2:
-            # Category view displays categories
-            categories = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-            
-            # Make sure selected_index is valid
-            if selected_index >= len(categories):
-                selected_index = 0 if categories else -1
-                
-            category_view(stdscr, terraform_data, selected_index, selected_block_index,
-                          file_scroll_offset, block_scroll_offset, content_scroll_offset, wrap_lines)
-        elif view == 3:
-            # Module view displays files with modules
-            files_with_modules = [f for f in terraform_data.keys() 
-                                 if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
+            if view == 1:
+                file_view(frame, terraform_data, raw_contents, terraform_files, selected_index, selected_block_index, 
+                         file_scroll_offset, block_scroll_offset, content_scroll_offset, wrap_lines)
+            elif view == 2:
+                category_view(frame, terraform_data, raw_contents, terraform_files, selected_index, selected_block_index,
+                              file_scroll_offset, block_scroll_offset, content_scroll_offset, wrap_lines)
+            elif view == 3:
+                module_view(frame, terraform_data, raw_contents, terraform_files, selected_index, selected_block_index,
+                            file_scroll_offset, block_scroll_offset, content_scroll_offset, wrap_lines)
             
-            # Make sure selected_index is valid
-            if selected_index >= len(files_with_modules):
-                selected_index = 0 if files_with_modules else -1
-                
-            module_view(stdscr, terraform_data, selected_index, selected_block_index,
-                        file_scroll_offset, block_scroll_offset, content_scroll_offset, wrap_lines)
-        
-        # Show status message at the bottom of the screen
-        if is_error_status and curses.has_colors():
-            stdscr.addstr(height-1, 0, status_message, curses.A_REVERSE)
+            # Show status message at the bottom of the screen
+            if is_error_status and _HAS_COLORS:
+                frame.addstr(height-1, 0, status_message, curses.A_REVERSE)
+            else:
+                frame.addstr(height-1, 0, status_message)
         else:
-            stdscr.addstr(height-1, 0, status_message)
+            # Copy the unchanged frame again so anything drawn over it on stdscr is repaired
+            frame.touchwin()
 
-        stdscr.refresh()
+        # Copy stdscr (used by the prompts and menus) and then the frame to the
+        # virtual screen, and send the differences to the terminal once
+        stdscr.noutrefresh()
+        frame.noutrefresh(0, 0, 0, 0, height - 1, width - 1)
+        curses.doupdate()
         key = stdscr.getch()
 
-        if key == ord('q'):
+        if key == -1:
+            # No input before the timeout: reload if a file changed on disk meanwhile
+            if reload_task is None and terraform_files_changed(working_directory):
+                reload_task = (parse_terraform_files_async(working_directory), None)
+        elif key == ord('q'):
             break
         elif key == ord('!'):  # Shift+1
             view = 1
@@ -1686,23 +2001,25 @@ def main(stdscr):
         elif key == ord('R'):  # Shift+R to reload application
             # Reload all Terraform data
             status_message = "Reloading Terraform files..."
-            stdscr.addstr(height-1, 0, status_message)
-            stdscr.refresh()
-            terraform_data = parse_terraform_files(".")
+            is_error_status = False
+            reload_task = (parse_terraform_files_async(working_directory), "Application reloaded successfully")
+            # Query the workspace again in case it was changed outside the TUI
+            _ws_cache.clear()
+            current_workspace = _workspace_name()
             # Reset view selections
             selected_block_index = -1 if active_column == 0 else selected_block_index
             file_scroll_offset = 0
             block_scroll_offset = 0
             content_scroll_offset = 0
-            status_message = "Application reloaded successfully"
-            is_error_status = False
         elif key == ord('W'):  # Shift+W for workspace management
             # Show workspace menu and get result
-            result = show_workspace_menu(stdscr, working_directory)
+            result, pending = show_workspace_menu(stdscr, working_directory)
+            if pending:
+                # Reported by the main loop once the command finishes
+                workspace_task = pending
+            current_workspace = _workspace_name()
             if result:
                 status_message = result
-                # Refresh terraform data in case workspace changed
-                terraform_data = parse_terraform_files(working_directory)
             else:
                 status_message = f"Current workspace: {get_current_terraform_workspace(working_directory)}"
             is_error_status = False
@@ -1716,7 +2033,7 @@ def main(stdscr):
             status_message = "Welcome back from help screen"
             is_error_status = False
         elif key == ord('/'):  # Search functionality
-            search_results = prompt_for_search(stdscr, terraform_data)
+            search_results = prompt_for_search(stdscr, terraform_data, raw_contents)
             if search_results:
                 # If we have results and in file view, try to navigate to the first result
                 if view == 1 and search_results:
@@ -1724,31 +2041,16 @@ def main(stdscr):
                     file_name, block_type, block_name = first_result
                     
                     # Find the file index
-                    files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-                    try:
-                        file_index = files.index(file_name)
+                    file_index = get_file_position(terraform_files, file_name)
+                    if file_index >= 0:
                         selected_index = file_index
                         
                         # If we have a block type and name, try to find and select it
                         if block_type and block_name:
-                            # Get blocks for this file
                             file_content = terraform_data.get(file_name, {})
-                            blocks = []
-                            if isinstance(file_content, dict):
-                                for bt, block_items in file_content.items():
-                                    if isinstance(block_items, list):
-                                        for item in block_items:
-                                            if isinstance(item, dict):
-                                                for bn in item.keys():
-                                                    blocks.append(f"{bt}.{bn}")
-                                    elif isinstance(block_items, dict):
-                                        for bn in block_items.keys():
-                                            blocks.append(f"{bt}.{bn}")
-                            
-                            # Look for the matching block
-                            target_block = f"{block_type}.{block_name}"
-                            if target_block in blocks:
-                                selected_block_index = blocks.index(target_block)
+                            block_index = get_block_position(file_name, file_content, block_type, block_name)
+                            if block_index >= 0:
+                                selected_block_index = block_index
                                 active_column = 1  # Move to block column
                             
                         # Adjust scroll positions
@@ -1756,8 +2058,6 @@ def main(stdscr):
                             file_scroll_offset = selected_index - (max_rows // 2)
                         if selected_block_index >= max_rows:
                             block_scroll_offset = selected_block_index - (max_rows // 2)
-                    except ValueError:
-                        pass  # File not found in the list
                 
                 # Update status message with result count
                 status_message = f"Found {len(search_results)} matches"
@@ -1773,104 +2073,14 @@ def main(stdscr):
             if (view == 1 and active_column >= 1 and 0 <= selected_block_index) or \
                ((view == 2 or view == 3) and 0 <= selected_block_index):
                 
-                # Get the appropriate content based on view type
+                # Get the content of the selected block of any view
                 block_content = ""
                 suggested_filename = ""
-                
-                if view == 1:  # File view
-                    files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-                    if 0 <= selected_index < len(files):
-                        selected_file = files[selected_index]
-                        file_content = terraform_data.get(selected_file, {})
-                        
-                        # Get blocks for this file
-                        blocks = []
-                        if isinstance(file_content, dict):
-                            for block_type, block_items in file_content.items():
-                                if isinstance(block_items, list):
-                                    for item in block_items:
-                                        if isinstance(item, dict):
-                                            for name in item.keys():
-                                                blocks.append(f"{block_type}.{name}")
-                                elif isinstance(block_items, dict):
-                                    for name in block_items.keys():
-                                        blocks.append(f"{block_type}.{name}")
-                        
-                        if 0 <= selected_block_index < len(blocks):
-                            block = blocks[selected_block_index]
-                            parts = block.split('.', 1)
-                            if len(parts) == 2:
-                                block_type, block_name = parts
-                                raw_content = terraform_data.get(selected_file + "_raw", "")
-                                
-                                # Handle quoted resource names
-                                if block_type == "resource" and '"' in block_name:
-                                    block_name = block_name.replace('"', '')
-                                    
-                                block_content = extract_block_content(raw_content, block_type, block_name)
-                                suggested_filename = f"{block_type}_{block_name}.tf"
-                
-                elif view == 2:  # Category view
-                    categories = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                    if 0 <= selected_index < len(categories):
-                        selected_category = categories[selected_index]
-                        
-                        # Find all items of this category
-                        items = []
-                        for file, content in terraform_data.items():
-                            if file.endswith("_raw"):
-                                continue
-                            if selected_category in content:
-                                if isinstance(content[selected_category], dict):
-                                    for item_name in content[selected_category]:
-                                        items.append(f"{file}:{item_name}")
-                                elif isinstance(content[selected_category], list):
-                                    for item in content[selected_category]:
-                                        if isinstance(item, dict):
-                                            for item_name in item:
-                                                items.append(f"{file}:{item_name}")
-                        
-                        if 0 <= selected_block_index < len(items):
-                            selected_item = items[selected_block_index]
-                            file_name, item_name = selected_item.split(":", 1)
-                            
-                            # Get raw file content
-                            raw_content = terraform_data.get(file_name + "_raw", "")
-                            
-                            # Extract the block content
-                            block_content = extract_block_content(raw_content, selected_category, item_name)
-                            suggested_filename = f"{selected_category}_{item_name}.tf"
-                
-                elif view == 3:  # Module view
-                    files_with_modules = []
-                    for file, content in terraform_data.items():
-                        if file.endswith("_raw"):
-                            continue
-                        if 'module' in content and content['module']:
-                            files_with_modules.append(file)
-                            
-                    if 0 <= selected_index < len(files_with_modules):
-                        selected_file = files_with_modules[selected_index]
-                        file_content = terraform_data.get(selected_file, {})
-                        
-                        modules = []
-                        if 'module' in file_content:
-                            if isinstance(file_content['module'], dict):
-                                modules = list(file_content['module'].keys())
-                            elif isinstance(file_content['module'], list):
-                                for item in file_content['module']:
-                                    if isinstance(item, dict):
-                                        modules.extend(list(item.keys()))
-                        
-                        if 0 <= selected_block_index < len(modules):
-                            selected_module = modules[selected_block_index]
-                            
-                            # Get raw file content
-                            raw_content = terraform_data.get(selected_file + "_raw", "")
-                            
-                            # Extract the module content
-                            block_content = extract_block_content(raw_content, "module", selected_module)
-                            suggested_filename = f"module_{selected_module}.tf"
+                selection = get_view_selection(view, terraform_data, terraform_files, selected_index, selected_block_index)
+                if selection is not None:
+                    file, block_type, block_name = selection
+                    block_content = get_cached_block_content(file, raw_contents.get(file, ""), block_type, block_name)
+                    suggested_filename = f"{block_type}_{block_name}.tf"
                 
                 # If we have content to save, call the save function
                 if block_content:
@@ -1907,75 +2117,56 @@ def main(stdscr):
         elif key == ord('e'):  # Edit the current block
             # Only allow editing when in file view with a block selected
             if view == 1 and active_column == 2 and 0 <= selected_block_index:
-                files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
+                files = terraform_files
                 if 0 <= selected_index < len(files):
                     selected_file = files[selected_index]
                     file_content = terraform_data.get(selected_file, {})
                     
                     # Get the list of blocks for the selected file
-                    blocks = []
-                    if isinstance(file_content, dict):
-                        for block_type, block_items in file_content.items():
-                            if isinstance(block_items, list):
-                                for item in block_items:
-                                    if isinstance(item, dict):
-                                        for name in item.keys():
-                                            blocks.append(f"{block_type}.{name}")
-                            elif isinstance(block_items, dict):
-                                for name in block_items.keys():
-                                    blocks.append(f"{block_type}.{name}")
+                    blocks = get_file_blocks(selected_file, file_content)
                     
                     if 0 <= selected_block_index < len(blocks):
-                        block = blocks[selected_block_index]
-                        parts = block.split('.', 1)
-                        if len(parts) == 2:
-                            block_type, block_name = parts
-                            
-                            # Get raw file content
-                            raw_content = terraform_data.get(selected_file + "_raw", "")
-                            
-                            # Special handling for resource blocks - both parts can contain quotes
-                            if block_type == "resource" and '"' in block_name:
-                                block_name = block_name.replace('"', '')
-                            
-                            # Find the block content
-                            block_content = extract_block_content(raw_content, block_type, block_name)
-                            
-                            # Prepare to launch the editor
-                            status_message = "Launching editor..."
-                            h, w = stdscr.getmaxyx()
-                            stdscr.addstr(h-1, 0, status_message)
-                            stdscr.refresh()
-                            
-                            # Properly close curses before launching the editor
-                            curses.def_prog_mode()  # Save the current state
-                            curses.endwin()         # End curses mode temporarily
-                            
-                            # Call the editor
-                            file_path = os.path.join(".", selected_file)
-                            success, message = edit_block_content(file_path, block_type, block_name, block_content)
-                            
-                            # Restore terminal to curses mode
-                            stdscr = curses.initscr()  # Re-initialize the screen
-                            curses.reset_prog_mode()   # Restore saved state
-                            
-                            # Re-establish window attributes and settings
-                            curses.curs_set(0)         # Hide cursor
-                            if curses.has_colors():
-                                init_colors()
-                            stdscr.keypad(True)
-                            stdscr.nodelay(True)       # Non-blocking input
-                            
-                            if success:
-                                # Reload the terraform data to get updated content
-                                terraform_data = parse_terraform_files(".")
-                                status_message = message
-                                is_error_status = False
-                            else:
-                                status_message = message
-                                is_error_status = True
+                        # Resource names already have their quotes stripped in lookup_name
+                        block_type, _, block_name = blocks[selected_block_index]
+                        
+                        # Get raw file content
+                        raw_content = raw_contents.get(selected_file, "")
+                        
+                        # Find the block content and where it sits in the file
+                        block_content, block_start, block_end = get_cached_block_span(selected_file, raw_content, block_type, block_name)
+                        
+                        # Prepare to launch the editor
+                        status_message = "Launching editor..."
+                        h, w = stdscr.getmaxyx()
+                        stdscr.addstr(h-1, 0, status_message)
+                        stdscr.refresh()
+                        
+                        # Properly close curses before launching the editor
+                        curses.def_prog_mode()  # Save the current state
+                        curses.endwin()         # End curses mode temporarily
+                        
+                        # Call the editor
+                        file_path = os.path.join(working_directory, selected_file)
+                        success, message = edit_block_content(file_path, block_type, block_name, block_content, block_start, block_end)
+                        
+                        # Restore terminal to curses mode
+                        stdscr = curses.initscr()  # Re-initialize the screen
+                        curses.reset_prog_mode()   # Restore saved state
+                        
+                        # Re-establish window attributes and settings
+                        curses.curs_set(0)         # Hide cursor
+                        if curses.has_colors():
+                            init_colors()
+                        stdscr.keypad(True)
+                        stdscr.nodelay(True)       # Non-blocking input
+                        
+                        if success:
+                            # Reload the terraform data to get updated content
+                            reload_task = (parse_terraform_files_async(working_directory), None)
+                            status_message = message
+                            is_error_status = False
                         else:
-                            status_message = "Invalid block format for editing"
+                            status_message = message
                             is_error_status = True
             elif view != 1:
                 status_message = "Editing is only available in file view"
@@ -1984,77 +2175,28 @@ def main(stdscr):
                 status_message = "Select a block to edit (use Tab to move to blocks)"
                 is_error_status = True
         elif view == 1:
-            # Get list of files (excluding _raw entries)
-            files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
+            # Entries of the first two columns, computed once for every key below
+            files = get_view_items(view, terraform_data, terraform_files)
+            blocks = get_view_blocks(view, terraform_data, terraform_files, selected_index)
             
-            # Get blocks for the current file
-            blocks = []
-            if selected_index < len(files):
-                selected_file = files[selected_index]
-                file_content = terraform_data.get(selected_file, {})
-                
-                if isinstance(file_content, dict):
-                    for block_type, block_items in file_content.items():
-                        if isinstance(block_items, list):
-                            for item in block_items:
-                                if isinstance(item, dict):
-                                    for name in item.keys():
-                                        blocks.append(f"{block_type}.{name}")
-                        elif isinstance(block_items, dict):
-                            for name in block_items.keys():
-                                blocks.append(f"{block_type}.{name}")
-            
-            # Get content lines for wrapping calculation
+            # Get content lines for wrapping calculation, only needed to bound
+            # scrolling in the content column
             content_lines = []
-            if 0 <= selected_block_index < len(blocks) and selected_index < len(files):
+            if active_column == 2 and 0 <= selected_block_index < len(blocks) and selected_index < len(files):
                 selected_file = files[selected_index]
-                block = blocks[selected_block_index]
-                parts = block.split('.', 1)
-                if len(parts) == 2:
-                    block_type, block_name = parts
-                    raw_content = terraform_data.get(selected_file + "_raw", "")
-                    
-                    # Handle quoted resource names
-                    if block_type == "resource" and '"' in block_name:
-                        block_name = block_name.replace('"', '')
-                        
-                    block_content = extract_block_content(raw_content, block_type, block_name)
-                    # If wrapping is enabled, calculate wrapped lines
-                    if wrap_lines:
-                        col3_width = max(20, (width - 40) // 1)  # Approximate column width
-                        tmp_lines = []
-                        for original_line in block_content.split('\n'):
-                            if len(original_line) <= col3_width - 4:
-                                tmp_lines.append(original_line)
-                            else:
-                                # Simple word-wrap algorithm
-                                words = original_line.split(' ')
-                                current_line = ""
-                                for word in words:
-                                    if len(current_line) + len(word) + 1 <= col3_width - 4:
-                                        current_line += (word + ' ')
-                                    else:
-                                        tmp_lines.append(current_line)
-                                        current_line = word + ' '
-                                if current_line:
-                                    tmp_lines.append(current_line)
-                        content_lines = tmp_lines
-                    else:
-                        content_lines = block_content.split('\n')
+                # Resource names already have their quotes stripped in lookup_name
+                block_type, _, block_name = blocks[selected_block_index]
+                raw_content = raw_contents.get(selected_file, "")
+                
+                block_content = get_cached_block_content(selected_file, raw_content, block_type, block_name)
+                # Wrap the content exactly like file_view does, reusing its cached
+                # lines, so scrolling stops at the last line that is displayed
+                col3_width = _row_templates(width)[3][2]
+                content_lines = _wrap_lines(block_content, col3_width - 6, wrap_lines)
             
             if key == curses.KEY_DOWN:
                 # Handle navigation based on active column
                 if active_column == 0:  # File column
-                    # Get list of files based on current view
-                    if view == 1:
-                        files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-                    elif view == 2:
-                        # For category view, files are categories
-                        files = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                    elif view == 3:
-                        # For module view
-                        files = [f for f in terraform_data.keys() if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
-                    
                     if selected_index < len(files) - 1:
                         selected_index += 1
                         # Adjust scroll if selection goes out of view
@@ -2066,57 +2208,6 @@ def main(stdscr):
                         content_scroll_offset = 0
                         active_column = 0  # Ensure we stay in file column
                 elif active_column == 1:  # Block column
-                    # Calculate blocks based on current view and selection
-                    blocks = []
-                    if view == 1 and 0 <= selected_index < len(files):
-                        selected_file = files[selected_index]
-                        file_content = terraform_data.get(selected_file, {})
-                        
-                        if isinstance(file_content, dict):
-                            for block_type, block_items in file_content.items():
-                                if isinstance(block_items, list):
-                                    for item in block_items:
-                                        if isinstance(item, dict):
-                                            for name in item.keys():
-                                                blocks.append(f"{block_type}.{name}")
-                                elif isinstance(block_items, dict):
-                                    for name in block_items.keys():
-                                        blocks.append(f"{block_type}.{name}")
-                    elif view == 2:
-                        # For category view
-                        categories = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                        blocks = []
-                        if 0 <= selected_index < len(categories):
-                            selected_category = categories[selected_index]
-                            
-                            # Find all items of this category
-                            for file, content in terraform_data.items():
-                                if file.endswith("_raw"):
-                                    continue
-                                if selected_category in content:
-                                    if isinstance(content[selected_category], dict):
-                                        for item_name in content[selected_category]:
-                                            blocks.append(f"{file}:{item_name}")
-                                    elif isinstance(content[selected_category], list):
-                                        for item in content[selected_category]:
-                                            if isinstance(item, dict):
-                                                for item_name in item:
-                                                    blocks.append(f"{file}:{item_name}")
-                    elif view == 3:
-                        # For module view
-                        files_with_modules = [f for f in terraform_data.keys() if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
-                        if 0 <= selected_index < len(files_with_modules):
-                            selected_file = files_with_modules[selected_index]
-                            file_content = terraform_data.get(selected_file, {})
-                            
-                            if 'module' in file_content:
-                                if isinstance(file_content['module'], dict):
-                                    blocks = list(file_content['module'].keys())
-                                elif isinstance(file_content['module'], list):
-                                    for item in file_content['module']:
-                                        if isinstance(item, dict):
-                                            blocks.extend(list(item.keys()))
-        
                     if selected_block_index < len(blocks) - 1:
                         selected_block_index += 1
                         # Adjust scroll if selection goes out of view
@@ -2131,72 +2222,12 @@ def main(stdscr):
             elif key == curses.KEY_UP:
                 # Handle navigation based on active column
                 if active_column == 0:  # File column
-                    # Get list of files based on current view
-                    if view == 1:
-                        files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-                    elif view == 2:
-                        # For category view, files are categories
-                        files = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                    elif view == 3:
-                        # For module view
-                        files = [f for f in terraform_data.keys() if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
-                    
                     if selected_index > 0:
                         selected_index -= 1
                         # Adjust scroll if selection goes out of view
                         if selected_index < file_scroll_offset:
                             file_scroll_offset -= 1
                 elif active_column == 1:  # Block column
-                    # Calculate blocks based on current view and selection
-                    blocks = []
-                    if view == 1 and 0 <= selected_index < len(files):
-                        selected_file = files[selected_index]
-                        file_content = terraform_data.get(selected_file, {})
-                        
-                        if isinstance(file_content, dict):
-                            for block_type, block_items in file_content.items():
-                                if isinstance(block_items, list):
-                                    for item in block_items:
-                                        if isinstance(item, dict):
-                                            for name in item.keys():
-                                                blocks.append(f"{block_type}.{name}")
-                                elif isinstance(block_items, dict):
-                                    for name in block_items.keys():
-                                        blocks.append(f"{block_type}.{name}")
-                    elif view == 2:
-                        # For category view
-                        categories = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                        if 0 <= selected_index < len(categories):
-                            selected_category = categories[selected_index]
-                            
-                            # Find all items of this category
-                            for file, content in terraform_data.items():
-                                if file.endswith("_raw"):
-                                    continue
-                                if selected_category in content:
-                                    if isinstance(content[selected_category], dict):
-                                        for item_name in content[selected_category]:
-                                            blocks.append(f"{file}:{item_name}")
-                                    elif isinstance(content[selected_category], list):
-                                        for item in content[selected_category]:
-                                            if isinstance(item, dict):
-                                                for item_name in item:
-                                                    blocks.append(f"{file}:{item_name}")
-                    elif view == 3:
-                        # For module view
-                        files_with_modules = [f for f in terraform_data.keys() if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
-                        if 0 <= selected_index < len(files_with_modules):
-                            selected_file = files_with_modules[selected_index]
-                            file_content = terraform_data.get(selected_file, {})
-                            
-                            if 'module' in file_content:
-                                if isinstance(file_content['module'], dict):
-                                    blocks = list(file_content['module'].keys())
-                                elif isinstance(file_content['module'], list):
-                                    for item in file_content['module']:
-                                        if isinstance(item, dict):
-                                            blocks.extend(list(item.keys()))
-        
                     if selected_block_index > 0:
                         selected_block_index -= 1
                         # Adjust scroll if selection goes out of view
@@ -2211,25 +2242,20 @@ def main(stdscr):
                 if active_column == 0:  # File column
                     if selected_index + max_rows < len(files):
                         selected_index += max_rows
-                        file_scroll_offset += max_rows
-                        if file_scroll_offset + max_rows > len(files):
-                            file_scroll_offset = max(0, len(files) - max_rows)
+                        # Scroll a page, stopping where the last page is fully shown
+                        file_scroll_offset = min(file_scroll_offset + max_rows, max(0, len(files) - max_rows))
                         # Reset block selection when changing files
                         selected_block_index = -1
                         block_scroll_offset = 0
                 elif active_column == 1:  # Block column
                     if selected_block_index + max_rows < len(blocks):
                         selected_block_index += max_rows
-                        block_scroll_offset += max_rows
-                        if block_scroll_offset + max_rows > len(blocks):
-                            block_scroll_offset = max(0, len(blocks) - max_rows)
+                        block_scroll_offset = min(block_scroll_offset + max_rows, max(0, len(blocks) - max_rows))
                         # Reset content scroll
                         content_scroll_offset = 0
                 elif active_column == 2:  # Content column
                     if content_scroll_offset + max_rows < len(content_lines):
-                        content_scroll_offset += max_rows
-                        if content_scroll_offset + max_rows > len(content_lines):
-                            content_scroll_offset = max(0, len(content_lines) - max_rows)
+                        content_scroll_offset = min(content_scroll_offset + max_rows, len(content_lines) - max_rows)
             
             elif key == curses.KEY_PPAGE:  # Page Up
                 # Handle page up based on active column
@@ -2251,65 +2277,6 @@ def main(stdscr):
                         content_scroll_offset = max(0, content_scroll_offset - max_rows)
             
             elif key == 9:  # Tab key to switch columns
-                # Get appropriate files list based on the current view
-                if view == 1:
-                    files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-                elif view == 2:
-                    # For category view, files are categories
-                    files = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                elif view == 3:
-                    files = [f for f in terraform_data.keys() if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
-                
-                # Calculate blocks based on view and current selection
-                blocks = []
-                if view == 1 and 0 <= selected_index < len(files):
-                    selected_file = files[selected_index]
-                    file_content = terraform_data.get(selected_file, {})
-                    
-                    if isinstance(file_content, dict):
-                        for block_type, block_items in file_content.items():
-                            if isinstance(block_items, list):
-                                for item in block_items:
-                                    if isinstance(item, dict):
-                                        for name in item.keys():
-                                            blocks.append(f"{block_type}.{name}")
-                            elif isinstance(block_items, dict):
-                                for name in block_items.keys():
-                                    blocks.append(f"{block_type}.{name}")
-                elif view == 2:
-                    # For category view
-                    categories = ["resource", "variable", "data", "output", "locals", "provider", "module", "terraform"]
-                    if 0 <= selected_index < len(categories):
-                        selected_category = categories[selected_index]
-                        
-                        # Find all items of this category
-                        for file, content in terraform_data.items():
-                            if file.endswith("_raw"):
-                                continue
-                            if selected_category in content:
-                                if isinstance(content[selected_category], dict):
-                                    for item_name in content[selected_category]:
-                                        blocks.append(f"{file}:{item_name}")
-                                elif isinstance(content[selected_category], list):
-                                    for item in content[selected_category]:
-                                        if isinstance(item, dict):
-                                            for item_name in item:
-                                                blocks.append(f"{file}:{item_name}")
-                elif view == 3:
-                    # For module view
-                    files_with_modules = [f for f in terraform_data.keys() if not f.endswith("_raw") and has_modules(terraform_data.get(f, {}))]
-                    if 0 <= selected_index < len(files_with_modules):
-                        selected_file = files_with_modules[selected_index]
-                        file_content = terraform_data.get(selected_file, {})
-                        
-                        if 'module' in file_content:
-                            if isinstance(file_content['module'], dict):
-                                blocks = list(file_content['module'].keys())
-                            elif isinstance(file_content['module'], list):
-                                for item in file_content['module']:
-                                    if isinstance(item, dict):
-                                        blocks.extend(list(item.keys()))
-        
                 if active_column == 0:  # File column is active
                     # Switch to block column if there are blocks
                     if len(blocks) > 0:
@@ -2317,169 +2284,30 @@ def main(stdscr):
                         if selected_block_index == -1:
                             selected_block_index = 0
                 elif active_column == 1:  # Block column is active
-                    # Get content lines for the selected block
-                    content_lines = []
-                    if 0 <= selected_block_index < len(blocks) and 0 <= selected_index < len(files):
-                        # Logic to get content lines depends on the view
-                        if view == 1:
-                            selected_file = files[selected_index]
-                            block = blocks[selected_block_index]
-                            parts = block.split('.', 1)
-                            if len(parts) == 2:
-                                block_type, block_name = parts
-                                raw_content = terraform_data.get(selected_file + "_raw", "")
-                                if block_type == "resource" and '"' in block_name:
-                                    block_name = block_name.replace('"', '')
-                                block_content = extract_block_content(raw_content, block_type, block_name)
-                                content_lines = block_content.split('\n')
-                        elif view == 2:
-                            # For category view, content is the item details
-                            selected_category = categories[selected_index]
-                            item_name = blocks[selected_block_index].split(":", 1)[-1]
-                            
-                            # Find the file that contains this item
-                            for file, content in terraform_data.items():
-                                if file.endswith("_raw"):
-                                    continue
-                                if selected_category in content:
-                                    if isinstance(content[selected_category], dict):
-                                        if item_name in content[selected_category]:
-                                            # Found the item, extract its content
-                                            raw_content = terraform_data.get(file + "_raw", "")
-                                            block_content = extract_block_content(raw_content, selected_category, item_name)
-                                            content_lines = block_content.split('\n')
-                                            break
-                                    elif isinstance(content[selected_category], list):
-                                        for item in content[selected_category]:
-                                            if isinstance(item, dict) and item_name in item:
-                                                # Found the item in a list, extract its content
-                                                raw_content = terraform_data.get(file + "_raw", "")
-                                                block_content = extract_block_content(raw_content, selected_category, item_name)
-                                                content_lines = block_content.split('\n')
-                                                break
-                        elif view == 3:
-                            # For module view, content is the module details
-                            selected_file = files_with_modules[selected_index]
-                            module_name = blocks[selected_block_index]
-                            
-                            # Get raw content
-                            raw_content = terraform_data.get(selected_file + "_raw", "")
-                            
-                            # Extract module content
-                            block_content = extract_block_content(raw_content, "module", module_name)
-                            content_lines = block_content.split('\n')
-                    
-                    # Switch to content column if there's content
-                    if 0 <= selected_block_index < len(blocks) and len(content_lines) > 0:
+                    # Switch to content column if a block is selected (its content
+                    # always has at least one line)
+                    if 0 <= selected_block_index < len(blocks):
                         active_column = 2
                     else:
                         # Go back to file column if no content
                         active_column = 0
                         selected_block_index = -1
-        elif key == ord('/'):  # Search action
-            # Only allow search when in file view
-            if view == 1:
-                # Prompt for search term
-                search_results = prompt_for_search(stdscr, terraform_data)
-                
-                if search_results:
-                    # Display search results in a new view
-                    view = 1  # Switch to file view for displaying results
-                    selected_index = 0
-                    selected_block_index = -1
-                    
-                    # Prepare search result data structure
-                    search_data = {}
-                    for file_name, block_type, block_name in search_results:
-                        if file_name not in search_data:
-                            search_data[file_name] = {}
-                        if block_type:
-                            if block_type not in search_data[file_name]:
-                                search_data[file_name][block_type] = {}
-                            if block_name:
-                                if block_name not in search_data[file_name][block_type]:
-                                    search_data[file_name][block_type][block_name] = {}
-                    
-                    terraform_data = search_data  # Replace current data with search results
-                    file_scroll_offset = 0
-                    block_scroll_offset = 0
-                    content_scroll_offset = 0
-                else:
-                    status_message = "No results found"
-                    is_error_status = True
-            else:
-                status_message = "Search is only available in file view"
-                is_error_status = True
-        elif key == ord('s'):  # Save action
-            # Only allow save when in file view with a block selected
-            if view == 1 and active_column == 2 and 0 <= selected_block_index:
-                files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
-                if 0 <= selected_index < len(files):
-                    selected_file = files[selected_index]
-                    file_content = terraform_data.get(selected_file, {})
-                    
-                    # Get the list of blocks for the selected file
-                    blocks = []
-                    if isinstance(file_content, dict):
-                        for block_type, block_items in file_content.items():
-                            if isinstance(block_items, list):
-                                for item in block_items:
-                                    if isinstance(item, dict):
-                                        for name in item.keys():
-                                            blocks.append(f"{block_type}.{name}")
-                            elif isinstance(block_items, dict):
-                                for name in block_items.keys():
-                                    blocks.append(f"{block_type}.{name}")
-                    
-                    if 0 <= selected_block_index < len(blocks):
-                        block = blocks[selected_block_index]
-                        parts = block.split('.', 1)
-                        if len(parts) == 2:
-                            block_type, block_name = parts
-                            
-                            # Get raw file content
-                            raw_content = terraform_data.get(selected_file + "_raw", "")
-                            
-                            # Special handling for resource blocks - both parts can contain quotes
-                            if block_type == "resource" and '"' in block_name:
-                                block_name = block_name.replace('"', '')
-                            
-                            # Find the block content
-                            block_content = extract_block_content(raw_content, block_type, block_name)
-                            
-                            # Prompt for filename to save
-                            status_message = "Saving block to file..."
-                            h, w = stdscr.getmaxyx()
-                            stdscr.addstr(h-1, 0, status_message)
-                            stdscr.refresh()
-                            
-                            success, message = save_block_to_file(block_content, suggested_filename=block_name)
-                            if success:
-                                status_message = message
-                                is_error_status = False
-                            else:
-                                status_message = message
-                                is_error_status = True
-                        else:
-                            status_message = "Invalid block format for saving"
-                            is_error_status = True
-        elif key == ord('h'):  # Help action
-            show_help_screen(stdscr)
         elif key == ord('r'):  # Reload action
             # Reload the current view
             if view == 1:
                 # Reload file view data
-                files = [f for f in terraform_data.keys() if not f.endswith("_raw")]
+                files = terraform_files
                 if 0 <= selected_index < len(files):
                     selected_file = files[selected_index]
-                    terraform_data = parse_terraform_files(".")
+                    reload_task = (parse_terraform_files_async(working_directory), None)
                     # Reset scroll offsets
                     file_scroll_offset = 0
                     block_scroll_offset = 0
                     content_scroll_offset = 0
             else:
                 # For other views, just reload the data
-                terraform_data = parse_terraform_files(".")
+                reload_task = (parse_terraform_files_async(working_directory), None)
+            current_workspace = _workspace_name()
         
         # Additional key bindings for testing
         elif key == ord('t'):  # Test action (toggle view for testing)
@@ -2493,8 +2321,11 @@ def main(stdscr):
             new_directory = select_directory(stdscr)
             if new_directory != working_directory:
                 working_directory = new_directory
-                # Parse terraform files from the new directory
-                terraform_data = parse_terraform_files(working_directory)
+                # Parse terraform files from the new directory in the background,
+                # showing no files rather than the old directory's until they are in
+                terraform_data, raw_contents, terraform_files = {}, {}, []
+                data_generation += 1
+                reload_task = (parse_terraform_files_async(working_directory), None)
                 # Reset view selections
                 selected_index = 0
                 selected_block_index = -1
@@ -2507,6 +2338,7 @@ def main(stdscr):
 
 # Move the main wrapper call to the end of the file
 if __name__ == "__main__":
+    prune_disk_cache()
     try:
         curses.wrapper(main)
     except KeyboardInterrupt: